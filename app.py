@@ -5,8 +5,10 @@ World Retail Congress Speakers Scraper
 Main entry point for the application.
 """
 
-from views.streamlit_view import main
-
 if __name__ == "__main__":
+    # Import here so merely importing app.py stays cheap; the view module
+    # pulls in pandas/plotly and is only needed when actually running.
+    from views.streamlit_view import main
+
     # Run the Streamlit application
-    main()
\ No newline at end of file
+    main()
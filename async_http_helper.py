@@ -0,0 +1,72 @@
+"""
+Async HTTP helper for the World Retail Congress Speakers Scraper.
+
+This module provides plain-HTTP fetching for pages that don't need a
+JavaScript runtime. Fetching server-rendered HTML over httpx (with
+HTTP/2 connection reuse) is an order of magnitude cheaper than driving
+a Chromium page through Playwright, so callers should try this first
+and fall back to the browser only for JS-rendered pages.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+import httpx
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default bound on in-flight requests
+DEFAULT_CONCURRENCY = 16
+
+# Default per-request timeout in seconds
+DEFAULT_TIMEOUT = 10.0
+
+
+async def fetch_all_parallel(
+    urls: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> List[Optional[str]]:
+    """
+    Fetch several URLs concurrently over a shared HTTP/2 client.
+
+    Args:
+        urls: The URLs to fetch
+        concurrency: Maximum number of in-flight requests
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        List of response bodies in the same order as the input URLs;
+        entries are None for requests that failed.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(http2=True, timeout=timeout, follow_redirects=True) as client:
+        async def fetch_one(url: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return response.text
+                except httpx.HTTPError as e:
+                    logger.warning(f"HTTP fetch failed for {url}: {e}")
+                    return None
+
+        return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+
+async def fetch_html(url: str, timeout: float = DEFAULT_TIMEOUT) -> Optional[str]:
+    """
+    Fetch a single URL, returning None on failure.
+
+    Args:
+        url: The URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        The response body, or None if the request failed
+    """
+    results = await fetch_all_parallel([url], concurrency=1, timeout=timeout)
+    return results[0]
@@ -2,42 +2,149 @@
 Configuration module for the World Retail Congress Speakers Scraper.
 
 This module contains all configuration settings for the application.
+
+Settings live on a frozen Config dataclass instantiated exactly once, so
+the Path arithmetic and URL formatting are computed a single time per
+process. Module-level aliases are kept for the existing `config.NAME`
+call sites. Environment-dependent values are read through cached
+accessors so the env parsing also runs only on first use.
 """
 
+import functools
 import os
-from pathlib import Path
-
-# Base directories
-ROOT_DIR = Path(__file__).parent
-DATA_DIR = ROOT_DIR / "data"
-
-# Ensure data directory exists
-os.makedirs(DATA_DIR, exist_ok=True)
-
-# Output files
-OUTPUT_JSON_FILE = DATA_DIR / "speakers.json"
-OUTPUT_CSV_FILE = DATA_DIR / "speakers.csv"
-
-# URLs
-BASE_URL = "https://www.worldretailcongress.com"
-SPEAKERS_URL = f"{BASE_URL}/2025-speakers"
-
-# Browser settings
-HEADLESS_MODE = True
-VIEWPORT_WIDTH = 1920
-VIEWPORT_HEIGHT = 1080
-
-# Scraper settings
-MAX_PAGES = 2  # Number of pages to scrape
-SAVE_PROGRESS_INTERVAL = 10  # Save progress after every N speakers
-
-# Streamlit settings
-STREAMLIT_PORT = 8501
-STREAMLIT_TITLE = "World Retail Congress Speakers"
-STREAMLIT_FAVICON = "🌎"
-
-# OpenAI settings
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = "gpt-4-turbo"  # Using a model that supports web browsing
-ENABLE_COMPANY_ENRICHMENT = os.getenv("ENABLE_COMPANY_ENRICHMENT", "true").lower() == "true"
-ENABLE_WEB_ACCESS = True  # Allow the LLM to access the web for company information
\ No newline at end of file
+from dataclasses import dataclass
+
+# Plain os.path strings: cheaper to build than PosixPath objects and they
+# keep pathlib off the cold-start import path
+_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_ROOT_DIR, "data")
+
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable application configuration, computed once at import."""
+
+    # Base directories
+    ROOT_DIR: str = _ROOT_DIR
+    DATA_DIR: str = _DATA_DIR
+
+    # Output files
+    OUTPUT_JSON_FILE: str = os.path.join(_DATA_DIR, "speakers.json")
+    OUTPUT_JSONL_FILE: str = os.path.join(_DATA_DIR, "speakers.jsonl")  # Append-only scrape checkpoint
+    OUTPUT_CSV_FILE: str = os.path.join(_DATA_DIR, "speakers.csv")
+
+    # URLs
+    BASE_URL: str = "https://www.worldretailcongress.com"
+    SPEAKERS_URL: str = "https://www.worldretailcongress.com/2025-speakers"
+
+    # Site boilerplate blurb that must never be kept as a speaker description
+    GENERIC_DESCRIPTION: str = (
+        "Since 2007, World Retail Congress has been the premier platform for "
+        "in-depth research, content and events; driving retail growth and "
+        "inspiring valuable global connections."
+    )
+
+    # Browser settings
+    HEADLESS_MODE: bool = True
+    VIEWPORT_WIDTH: int = 1920
+    VIEWPORT_HEIGHT: int = 1080
+
+    # HTTP cache settings
+    CACHE_DIR: str = os.path.join(_DATA_DIR, "http_cache")
+    CACHE_TTL_SECONDS: int = 3600  # How long cached page HTML stays fresh
+
+    # Scraper settings
+    MAX_PAGES: int = 2  # Number of pages to scrape
+    MAX_CONCURRENCY: int = 5  # Maximum number of pages scraped concurrently
+    SAVE_PROGRESS_INTERVAL: int = 10  # Save progress after every N speakers
+
+    # Streamlit settings
+    STREAMLIT_PORT: int = 8501
+    STREAMLIT_TITLE: str = "World Retail Congress Speakers"
+    STREAMLIT_FAVICON: str = "🌎"
+
+    # OpenAI settings
+    OPENAI_MODEL_FAST: str = "gpt-4o-mini"  # Cheap model tried first for enrichment
+    OPENAI_MODEL_SMART: str = "gpt-4-turbo"  # Escalation model for hard cases
+    ENRICHMENT_CACHE_FILE: str = os.path.join(_DATA_DIR, "company_cache.json")
+    ENABLE_WEB_ACCESS: bool = True  # Allow the LLM to access the web for company information
+
+
+# Single shared instance; attribute access never recomputes anything
+CONFIG = Config()
+
+# Module-level aliases for existing `config.NAME` call sites
+ROOT_DIR = CONFIG.ROOT_DIR
+DATA_DIR = CONFIG.DATA_DIR
+OUTPUT_JSON_FILE = CONFIG.OUTPUT_JSON_FILE
+OUTPUT_JSONL_FILE = CONFIG.OUTPUT_JSONL_FILE
+OUTPUT_CSV_FILE = CONFIG.OUTPUT_CSV_FILE
+BASE_URL = CONFIG.BASE_URL
+SPEAKERS_URL = CONFIG.SPEAKERS_URL
+GENERIC_DESCRIPTION = CONFIG.GENERIC_DESCRIPTION
+HEADLESS_MODE = CONFIG.HEADLESS_MODE
+VIEWPORT_WIDTH = CONFIG.VIEWPORT_WIDTH
+VIEWPORT_HEIGHT = CONFIG.VIEWPORT_HEIGHT
+
+# Trimmed-down Chromium launch: GPU, sandbox, extensions and background
+# networking are dead weight for headless text scraping, and disabling
+# them cuts per-browser RSS and startup time
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=site-per-process,TranslateUI,BlinkGenPropertyTrees",
+    "--no-first-run",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Resource types aborted via context.route: the scraper only reads text,
+# so images, styles, fonts and media are wasted bandwidth and renderer work
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+# Prebuilt Playwright option dicts so call sites don't rebuild them
+LAUNCH_OPTS = {"headless": HEADLESS_MODE, "args": CHROMIUM_ARGS}
+CONTEXT_OPTS = {
+    "viewport": {"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
+    "ignore_https_errors": True,
+}
+CACHE_DIR = CONFIG.CACHE_DIR
+CACHE_TTL_SECONDS = CONFIG.CACHE_TTL_SECONDS
+MAX_PAGES = CONFIG.MAX_PAGES
+MAX_CONCURRENCY = CONFIG.MAX_CONCURRENCY
+SAVE_PROGRESS_INTERVAL = CONFIG.SAVE_PROGRESS_INTERVAL
+STREAMLIT_PORT = CONFIG.STREAMLIT_PORT
+STREAMLIT_TITLE = CONFIG.STREAMLIT_TITLE
+STREAMLIT_FAVICON = CONFIG.STREAMLIT_FAVICON
+OPENAI_MODEL_FAST = CONFIG.OPENAI_MODEL_FAST
+OPENAI_MODEL_SMART = CONFIG.OPENAI_MODEL_SMART
+OPENAI_MODEL = CONFIG.OPENAI_MODEL_SMART  # Backwards-compatible alias
+ENRICHMENT_CACHE_FILE = CONFIG.ENRICHMENT_CACHE_FILE
+ENABLE_WEB_ACCESS = CONFIG.ENABLE_WEB_ACCESS
+
+def ensure_data_dir() -> None:
+    """Create the data directory if needed.
+
+    Kept out of module import so Streamlit reruns (which re-import the
+    script top-to-bottom) don't pay a stat+mkdir syscall each time; the
+    scraper entry points call this once before writing output.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+
+@functools.cache
+def get_openai_key() -> str:
+    """Return the OpenAI API key, reading the environment only once."""
+    return os.getenv("OPENAI_API_KEY", "")
+
+
+@functools.cache
+def enable_company_enrichment() -> bool:
+    """Return whether company enrichment is enabled, parsing the env once."""
+    return os.getenv("ENABLE_COMPANY_ENRICHMENT", "true").lower() == "true"
@@ -1,7 +1,30 @@
 """
 Controllers package for the World Retail Congress Speakers Scraper.
+
+The scraper controller pulls in Playwright, OpenAI and pandas, so it is
+loaded lazily (PEP 562) to keep `import controllers` cheap for consumers
+that never run the scraper.
 """
 
-from controllers.scraper_controller import ScraperController, run_scraper
+__all__ = ['ScraperController', 'run_scraper', 'start_scraper_async']
+
+
+def __getattr__(name):
+    """Load the scraper controller on first attribute access."""
+    if name in __all__:
+        from controllers.scraper_controller import (
+            ScraperController,
+            run_scraper,
+            start_scraper_async,
+        )
+        globals().update({
+            'ScraperController': ScraperController,
+            'run_scraper': run_scraper,
+            'start_scraper_async': start_scraper_async,
+        })
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['ScraperController', 'run_scraper']
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
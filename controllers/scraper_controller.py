@@ -7,18 +7,24 @@ This module contains the controller for scraping speaker data.
 import asyncio
 import json
 import logging
+import os
+import queue
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 # Add the project root directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
 
 import config
+from async_http_helper import fetch_all_parallel
 from models.speaker import Speaker, SpeakerCollection
-from utils.data_utils import save_to_json, save_to_csv, enrich_company_data
+from page_parsing import parse_speaker_cards, parse_speaker_detail
+from scrape_cache import cached_get_async, get_cached, set_cached
+from utils.data_utils import save_to_json, save_to_csv, append_to_jsonl, enrich_company_data
 
 # Configure logging
 logging.basicConfig(
@@ -27,25 +33,130 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Clicks the cookie consent button; defined once at module scope so the
+# snippet is not rebuilt on every accept_cookies call
+_COOKIE_ACCEPT_JS = """
+() => {
+    // Try multiple approaches to find and click the cookie button
+    
+    // Approach 1: Find by data-cky-tag attribute
+    const acceptButton = document.querySelector('button[data-cky-tag="accept-button"]');
+    if (acceptButton) {
+        console.log('Found cookie button by data-cky-tag');
+        acceptButton.click();
+        return true;
+    }
+    
+    // Approach 2: Find by aria-label
+    const ariaButton = document.querySelector('button[aria-label="Accept All"]');
+    if (ariaButton) {
+        console.log('Found cookie button by aria-label');
+        ariaButton.click();
+        return true;
+    }
+    
+    // Approach 3: Find by class
+    const classButton = document.querySelector('.cky-btn-accept');
+    if (classButton) {
+        console.log('Found cookie button by class');
+        classButton.click();
+        return true;
+    }
+    
+    // Approach 4: Find any button with "Accept All" text
+    const buttons = Array.from(document.querySelectorAll('button'));
+    const acceptAllButton = buttons.find(btn => 
+        btn.textContent.includes('Accept All')
+    );
+    
+    if (acceptAllButton) {
+        console.log('Found Accept All button by text content');
+        acceptAllButton.click();
+        return true;
+    }
+    
+    // Approach 5: Find any button with "Accept" text
+    const acceptButton2 = buttons.find(btn => 
+        btn.textContent.includes('Accept') || 
+        btn.textContent.includes('accept')
+    );
+    
+    if (acceptButton2) {
+        console.log('Found Accept button by text content');
+        acceptButton2.click();
+        return true;
+    }
+    
+    // Approach 6: Try clicking on any element that looks like a cookie banner button
+    const cookieBannerButtons = document.querySelectorAll('[class*="cookie"] button, [class*="consent"] button, [class*="privacy"] button');
+    if (cookieBannerButtons.length > 0) {
+        console.log('Found cookie banner button by class pattern');
+        cookieBannerButtons[0].click();
+        return true;
+    }
+    
+    return false;
+}
+"""
+
 
 class ScraperController:
     """Controller for scraping speaker data."""
     
     def __init__(self):
         """Initialize the scraper controller."""
+        config.ensure_data_dir()
         self.speaker_collection = SpeakerCollection()
         self.browser = None
         self.context = None
         self.page = None
-    
+        # Pool of reusable pages for detail extraction, filled in setup_browser
+        self._page_pool = None
+        # Set once the cookie banner has been dismissed for this session, so
+        # concurrent page tasks don't all re-run the banner dance
+        self.cookie_dismissed = asyncio.Event()
+        # Bounds the number of speaker pages open at once
+        self._sem = asyncio.Semaphore(config.MAX_CONCURRENCY)
+        # Detail URLs already dispatched, so repeated cards across
+        # paginated listings don't trigger repeat navigations
+        self._seen_urls: set = set()
+        # Optional queue for progress messages consumed by the UI
+        self.progress_queue = None
+
+    def report_progress(self, message: str) -> None:
+        """Push a progress message to the attached queue, if any."""
+        if self.progress_queue is not None:
+            self.progress_queue.put(message)
+
     async def setup_browser(self) -> None:
-        """Set up the browser for scraping."""
+        """Set up the browser for scraping.
+
+        One browser and one context are launched per session and reused
+        across all pages, avoiding the 1-2s Chromium cold start per page.
+        """
         playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=config.HEADLESS_MODE)
-        self.context = await self.browser.new_context(
-            viewport={'width': config.VIEWPORT_WIDTH, 'height': config.VIEWPORT_HEIGHT}
+        self.browser = await playwright.chromium.launch(**config.LAUNCH_OPTS)
+        self.context = await self.browser.new_context(**config.CONTEXT_OPTS)
+
+        # Abort requests for heavy static assets before they hit the
+        # network; cookie dismissal is JS-driven so it survives without CSS
+        await self.context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in config.BLOCKED_RESOURCE_TYPES
+            else route.continue_(),
         )
+
+        # Ask the server to keep connections open between speaker fetches
+        await self.context.set_extra_http_headers({"Connection": "keep-alive"})
+
         self.page = await self.context.new_page()
+
+        # Pre-create the pages used for speaker detail extraction; pages
+        # are recycled through the pool instead of built per speaker
+        self._page_pool = asyncio.Queue()
+        for _ in range(config.MAX_CONCURRENCY):
+            self._page_pool.put_nowait(await self.context.new_page())
     
     async def teardown_browser(self) -> None:
         """Close the browser."""
@@ -53,104 +164,62 @@ class ScraperController:
             await self.browser.close()
     
     async def accept_cookies(self, page: Page) -> None:
-        """Accept cookies on the page if the cookie banner is present."""
+        """Accept cookies on the page if the cookie banner is present.
+
+        The consent cookie is shared by the whole BrowserContext, so after
+        one successful acceptance every later call returns immediately
+        instead of burning retries on pages where the banner never shows.
+        """
+        if self.cookie_dismissed.is_set():
+            return
         try:
             # Wait for the cookie banner to appear
             logger.info("Looking for cookie consent banner...")
-            
-            # Try JavaScript approach with multiple attempts
-            for attempt in range(3):
-                clicked = await page.evaluate("""
-                () => {
-                    // Try multiple approaches to find and click the cookie button
-                    
-                    // Approach 1: Find by data-cky-tag attribute
-                    const acceptButton = document.querySelector('button[data-cky-tag="accept-button"]');
-                    if (acceptButton) {
-                        console.log('Found cookie button by data-cky-tag');
-                        acceptButton.click();
-                        return true;
-                    }
-                    
-                    // Approach 2: Find by aria-label
-                    const ariaButton = document.querySelector('button[aria-label="Accept All"]');
-                    if (ariaButton) {
-                        console.log('Found cookie button by aria-label');
-                        ariaButton.click();
-                        return true;
-                    }
-                    
-                    // Approach 3: Find by class
-                    const classButton = document.querySelector('.cky-btn-accept');
-                    if (classButton) {
-                        console.log('Found cookie button by class');
-                        classButton.click();
-                        return true;
-                    }
-                    
-                    // Approach 4: Find any button with "Accept All" text
-                    const buttons = Array.from(document.querySelectorAll('button'));
-                    const acceptAllButton = buttons.find(btn => 
-                        btn.textContent.includes('Accept All')
-                    );
-                    
-                    if (acceptAllButton) {
-                        console.log('Found Accept All button by text content');
-                        acceptAllButton.click();
-                        return true;
-                    }
-                    
-                    // Approach 5: Find any button with "Accept" text
-                    const acceptButton2 = buttons.find(btn => 
-                        btn.textContent.includes('Accept') || 
-                        btn.textContent.includes('accept')
-                    );
-                    
-                    if (acceptButton2) {
-                        console.log('Found Accept button by text content');
-                        acceptButton2.click();
-                        return true;
-                    }
-                    
-                    // Approach 6: Try clicking on any element that looks like a cookie banner button
-                    const cookieBannerButtons = document.querySelectorAll('[class*="cookie"] button, [class*="consent"] button, [class*="privacy"] button');
-                    if (cookieBannerButtons.length > 0) {
-                        console.log('Found cookie banner button by class pattern');
-                        cookieBannerButtons[0].click();
-                        return true;
-                    }
-                    
-                    return false;
-                }
-                """)
-                
-                if clicked:
-                    logger.info("Successfully clicked cookie button via JavaScript")
-                    await page.wait_for_timeout(1000)
-                    return
-                else:
-                    logger.warning(f"Could not find cookie button via JavaScript (attempt {attempt+1}/3)")
-                    await page.wait_for_timeout(1000)  # Wait a bit and try again
+
+            # A single bounded wait on the banner selectors replaces the
+            # old 3-attempt loop with 1s sleeps: it returns as soon as the
+            # banner shows and gives up quickly when it never will
+            try:
+                await page.wait_for_selector(
+                    'button[data-cky-tag="accept-button"], '
+                    '.cky-btn-accept, '
+                    'button[aria-label="Accept All"]',
+                    timeout=2000,
+                )
+            except Exception:
+                logger.info("No cookie consent banner appeared")
+                return
+
+            clicked = await page.evaluate(_COOKIE_ACCEPT_JS)
+
+            if clicked:
+                logger.info("Successfully clicked cookie button via JavaScript")
+                await page.wait_for_timeout(1000)
+                self.cookie_dismissed.set()
+                return
+            else:
+                logger.warning("Could not find cookie button via JavaScript")
             
             # If we get here, we couldn't click the cookie button with JavaScript
-            # Try clicking with Playwright's built-in methods
+            # Try clicking with Playwright's built-in methods, matching all
+            # candidate selectors in one DOM walk instead of one
+            # query_selector round-trip per selector
             try:
-                # Look for common cookie consent button selectors
-                for selector in [
-                    'button[data-cky-tag="accept-button"]',
-                    'button[aria-label="Accept All"]',
-                    '.cky-btn-accept',
-                    'button:has-text("Accept All")',
-                    'button:has-text("Accept")',
-                    '[class*="cookie"] button',
-                    '[class*="consent"] button',
+                locator = page.locator(
+                    'button[data-cky-tag="accept-button"], '
+                    'button[aria-label="Accept All"], '
+                    '.cky-btn-accept, '
+                    'button:has-text("Accept All"), '
+                    'button:has-text("Accept"), '
+                    '[class*="cookie"] button, '
+                    '[class*="consent"] button, '
                     '[class*="privacy"] button'
-                ]:
-                    if await page.query_selector(selector):
-                        await page.click(selector)
-                        logger.info(f"Successfully clicked cookie button using selector: {selector}")
-                        await page.wait_for_timeout(1000)
-                        return
+                )
+                await locator.first.click(timeout=2000)
+                logger.info("Successfully clicked cookie button via Playwright locator")
+                await page.wait_for_timeout(1000)
+                self.cookie_dismissed.set()
+                return
             except Exception as e:
                 logger.warning(f"Error clicking cookie button with Playwright: {e}")
                 
@@ -168,70 +237,23 @@ class ScraperController:
             List of dictionaries containing speaker information
         """
         logger.info("Finding speaker links on the page...")
-        
-        # Get all speaker cards
-        speaker_cards = await page.evaluate("""
-        () => {
-            // Find all speaker cards
-            const speakerItems = document.querySelectorAll('.m-speakers-list__items__item, [class*="speaker-item"]');
-            
-            return Array.from(speakerItems).map(item => {
-                // Find the link, name, position, and company
-                const link = item.querySelector('a');
-                const nameEl = item.querySelector('h2, h3, h4, [class*="name"]');
-                const positionEl = item.querySelector('[class*="position"], [class*="job"]');
-                const companyEl = item.querySelector('[class*="company"], [class*="organization"]');
-                
-                // Get the onclick attribute or href that contains openRemoteModal
-                let modalInfo = null;
-                let speakerUrl = null;
-                
-                if (link) {
-                    const onclick = link.getAttribute('onclick');
-                    const href = link.getAttribute('href');
-                    
-                    if (onclick && onclick.includes('openRemoteModal')) {
-                        modalInfo = onclick;
-                        
-                        // Extract the speaker URL from the modalInfo
-                        const match = onclick.match(/openRemoteModal\\('([^']+)'/);
-                        if (match) {
-                            speakerUrl = match[1];
-                        }
-                    } else if (href && href.includes('openRemoteModal')) {
-                        modalInfo = href;
-                        
-                        // Extract the speaker URL from the href
-                        const match = href.match(/openRemoteModal\\('([^']+)'/);
-                        if (match) {
-                            speakerUrl = match[1];
-                        }
-                    } else if (href) {
-                        speakerUrl = href;
-                    }
-                }
-                
-                return {
-                    name: nameEl ? nameEl.textContent.trim() : 'Unknown',
-                    position: positionEl ? positionEl.textContent.trim() : 'Unknown',
-                    company: companyEl ? companyEl.textContent.trim() : 'Unknown',
-                    modalInfo: modalInfo,
-                    speakerUrl: speakerUrl
-                };
-            });
-        }
-        """)
-        
+
+        # One content() round-trip, then parse in Python (selectolax) —
+        # avoids marshalling a large JS snippet and its result over CDP
+        html = await page.content()
+        speaker_cards = parse_speaker_cards(html)
+
         logger.info(f"Found {len(speaker_cards)} speaker cards on current page")
         return speaker_cards
     
-    async def extract_speaker_details(self, page: Page, browser: Browser, speaker: Dict) -> Speaker:
+    async def extract_speaker_details(self, speaker: Dict) -> Speaker:
         """
         Extract detailed information for a speaker by navigating to their page.
-        
+
+        Navigation happens on a page borrowed from the shared pool, so no
+        per-speaker page construction is paid.
+
         Args:
-            page: The Playwright page object
-            browser: The Playwright browser object
             speaker: Dictionary containing basic speaker information
             
         Returns:
@@ -251,217 +273,56 @@ class ScraperController:
                     
                 logger.info(f"Navigating to speaker page: {speaker_url}")
                 
-                # Open a new page for the speaker
-                speaker_page = await browser.new_page()
-                await speaker_page.goto(speaker_url)
-                await speaker_page.wait_for_load_state("networkidle")
-                
-                # Accept cookies if needed
-                await self.accept_cookies(speaker_page)
-                
-                # Extract detailed information with improved selectors
-                detail_data = await speaker_page.evaluate(f"""
-                () => {{
-                    // Function to clean text (remove extra whitespace, newlines, etc.)
-                    function cleanText(text) {{
-                        if (!text) return '';
-                        return text.replace(/\\s+/g, ' ').trim();
-                    }}
-                    
-                    // Function to check if text is from a cookie consent banner
-                    function isCookieConsentText(text) {{
-                        if (!text) return false;
-                        
-                        const cookieKeywords = [
-                            'cookie', 'consent', 'privacy', 'necessary cookies', 
-                            'data protection', 'gdpr', 'personal data', 
-                            'tracking', 'third party', 'third-party'
-                        ];
-                        
-                        const lowerText = text.toLowerCase();
-                        return cookieKeywords.some(keyword => lowerText.includes(keyword.toLowerCase()));
-                    }}
-                    
-                    // Extract description - look for paragraphs
-                    let description = 'No description available';
-                    const paragraphs = document.querySelectorAll('p');
-                    if (paragraphs.length > 0) {{
-                        // Use the longest paragraph as the description
-                        let longestText = '';
-                        for (const p of paragraphs) {{
-                            const text = p.textContent.trim();
-                            // Skip cookie consent text
-                            if (text.length > longestText.length && !isCookieConsentText(text)) {{
-                                longestText = text;
-                            }}
-                        }}
-                        if (longestText) {{
-                            description = longestText;
-                        }}
-                    }}
-                    
-                    // Extract session information
-                    let sessionInfo = {{
-                        title: 'Not available',
-                        date: 'Not available',
-                        time: 'Not available',
-                        venue: 'Not available'
-                    }};
-                    
-                    // Look for elements that might contain session information
-                    const sessionElements = document.querySelectorAll('.session-title, [class*="session"], [class*="talk"], [class*="presentation"]');
-                    for (const el of sessionElements) {{
-                        const text = cleanText(el.textContent);
-                        if (text && text.length > 0 && 
-                            text !== 'We value your privacy' && 
-                            !isCookieConsentText(text)) {{
-                            
-                            // Try to parse the session information
-                            // Example format: "Sessions 13-May-2025 12:10 – 12:50 Track 2 Debate: From Traffic to Revenue: Unlock Platform Success with Retail Media"
-                            
-                            // Extract date
-                            const dateMatch = text.match(/(\\d{{1,2}})[-–]May[-–](\\d{{4}})/);
-                            if (dateMatch) {{
-                                sessionInfo.date = `${{dateMatch[1]}} May ${{dateMatch[2]}}`;
-                            }}
-                            
-                            // Extract time
-                            const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[–-]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                            if (timeMatch) {{
-                                sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                            }}
-                            
-                            // Extract venue (Track or Suite)
-                            const venueMatch = text.match(/Track\\s*(\\d+)|([\\w\\s]+Suite)/);
-                            if (venueMatch) {{
-                                sessionInfo.venue = venueMatch[0];
-                            }}
-                            
-                            // Extract title - assume it's after "Debate:" or similar keywords
-                            const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                            if (titleMatch) {{
-                                sessionInfo.title = titleMatch[1].trim();
-                            }} else {{
-                                // If no specific keyword, just use the last part of the text
-                                const parts = text.split(':');
-                                if (parts.length > 1) {{
-                                    sessionInfo.title = parts[parts.length - 1].trim();
-                                }}
-                            }}
-                            
-                            break;
-                        }}
-                    }}
-                    
-                    // If session title not found, try other heading elements
-                    if (sessionInfo.title === 'Not available') {{
-                        const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
-                        for (const h of headings) {{
-                            const text = cleanText(h.textContent);
-                            // Skip common navigation/website headings and cookie consent text
-                            if (text && text.length > 0 && 
-                                !text.includes('About') && 
-                                !text.includes('Programme') && 
-                                !text.includes('Sponsor') && 
-                                !text.includes('Insights') &&
-                                !text.includes('BOOK YOUR PLACE') &&
-                                !text.includes('We value your privacy') &&
-                                !isCookieConsentText(text)) {{
-                                
-                                // Check if it's a session title
-                                if (text.includes('Debate:') || 
-                                    text.includes('Briefing:') || 
-                                    text.includes('Keynote:') || 
-                                    text.includes('Panel:')) {{
-                                    
-                                    // Extract the title part
-                                    const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                                    if (titleMatch) {{
-                                        sessionInfo.title = titleMatch[1].trim();
-                                    }} else {{
-                                        sessionInfo.title = text;
-                                    }}
-                                    break;
-                                }}
-                            }}
-                        }}
-                    }}
-                    
-                    // Extract date/time if not found in session info
-                    if (sessionInfo.date === 'Not available' || sessionInfo.time === 'Not available') {{
-                        const dateElements = document.querySelectorAll('[class*="date"], [class*="time"], [class*="schedule"], time');
-                        for (const el of dateElements) {{
-                            const text = cleanText(el.textContent);
-                            if (text && text.length > 0 && 
-                                !text.includes('About') && 
-                                !text.includes('Programme') && 
-                                !text.includes('Sponsor') && 
-                                !text.includes('Insights') &&
-                                !isCookieConsentText(text)) {{
-                                
-                                // Extract date
-                                const dateMatch = text.match(/(\\d{{1,2}})(?:st|nd|rd|th)?\\s*[-–]\\s*(\\d{{1,2}})(?:st|nd|rd|th)?\\s*May\\s*(\\d{{4}})?/);
-                                if (dateMatch) {{
-                                    sessionInfo.date = dateMatch[0];
-                                }}
-                                
-                                // Extract time
-                                const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[-–]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                                if (timeMatch) {{
-                                    sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                                }}
-                                
-                                break;
-                            }}
-                        }}
-                    }}
-                    
-                    // If venue not found in session info, look for it separately
-                    if (sessionInfo.venue === 'Not available') {{
-                        const venueElements = document.querySelectorAll('[class*="location"], [class*="venue"], [class*="place"], [class*="track"]');
-                        for (const el of venueElements) {{
-                            const text = cleanText(el.textContent);
-                            if (text && text.length > 0 && 
-                                (text.includes('Track') || 
-                                 text.includes('Room') || 
-                                 text.includes('Hall') || 
-                                 text.includes('Suite') ||
-                                 text.includes('Stage')) &&
-                                !isCookieConsentText(text)) {{
-                                sessionInfo.venue = text;
-                                break;
-                            }}
-                        }}
-                    }}
-                    
-                    // Clean up the date field
-                    if (sessionInfo.date.includes('12th - 14th May 2025')) {{
-                        sessionInfo.date = '12th - 14th May 2025';
-                    }}
-                    
-                    return {{
-                        description,
-                        session_title: sessionInfo.title,
-                        date: sessionInfo.date,
-                        time: sessionInfo.time,
-                        venue: sessionInfo.venue
-                    }};
-                }}
-                """)
-                
-                # Close the speaker page
-                await speaker_page.close()
-                
-                # Create a Speaker object
+                async def fetch_with_browser() -> str:
+                    """Render the speaker page and return its HTML."""
+                    async with self._sem:
+                        # Borrow a pre-created page from the pool
+                        speaker_page = await self._page_pool.get()
+                        try:
+                            # domcontentloaded + a targeted selector wait beats
+                            # networkidle, which stalls on long-lived trackers.
+                            # Retries are bounded so a hung page can't pin a
+                            # semaphore slot indefinitely (~17s worst case).
+                            for attempt in range(3):
+                                try:
+                                    await speaker_page.goto(speaker_url, wait_until="domcontentloaded", timeout=10000)
+                                    break
+                                except PlaywrightTimeoutError:
+                                    if attempt == 2:
+                                        raise
+                                    logger.warning(f"Timed out loading {speaker_url} (attempt {attempt+1}/3), retrying...")
+                                    await asyncio.sleep(0.5 * (2 ** attempt))
+                            await speaker_page.wait_for_selector("p", timeout=5000)
+
+                            # Accept cookies if needed
+                            await self.accept_cookies(speaker_page)
+
+                            # Grab the rendered HTML once; all field
+                            # extraction happens in Python below
+                            return await speaker_page.content()
+
+                        finally:
+                            # Return the page as-is: the next borrower navigates
+                            # straight to its URL, keeping the HTTP/2 session to
+                            # the speakers host alive instead of resetting via
+                            # about:blank
+                            await self._page_pool.put(speaker_page)
+
+                # Within the cache TTL the rendered HTML comes straight off
+                # disk and the browser is never touched, so repeated dev
+                # runs re-parse instead of re-fetching
+                html = await cached_get_async(speaker_url, fetch_with_browser)
+
+                # Parse outside the semaphore so the pooled page is
+                # already freed while we chew on the HTML; the parser's
+                # keys match the Speaker fields, so splat it directly
+                detail_data = parse_speaker_detail(html)
+
                 return Speaker(
                     name=speaker_name,
                     position=speaker.get('position', 'Unknown'),
                     company=speaker.get('company', 'Unknown'),
-                    description=detail_data.get('description', 'No description available'),
-                    session_title=detail_data.get('session_title', 'Not available'),
-                    date=detail_data.get('date', 'Not available'),
-                    time=detail_data.get('time', 'Not available'),
-                    location=detail_data.get('venue', 'Not available')
+                    **detail_data,
                 )
             else:
                 logger.warning(f"No speaker URL found for {speaker_name}")
@@ -483,120 +344,163 @@ class ScraperController:
                 location='Error'
             )
     
+    async def scrape_listing_page(
+        self, page_num: int, semaphore: asyncio.Semaphore, html: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Scrape the speaker cards from a single listing page.
+
+        Args:
+            page_num: The 1-based listing page number
+            semaphore: Semaphore bounding the number of concurrent pages
+            html: Pre-fetched page HTML; when given, it is parsed directly
+                and no browser page is opened
+
+        Returns:
+            List of dictionaries containing speaker information
+        """
+        if html is not None:
+            return parse_speaker_cards(html)
+
+        if page_num == 1:
+            page_url = config.SPEAKERS_URL
+        else:
+            page_url = f"{config.SPEAKERS_URL}?page={page_num}"
+
+        async with semaphore:
+            logger.info(f"Navigating to {page_url}")
+            page = await self.context.new_page()
+            try:
+                # Wait for the speaker cards themselves rather than
+                # networkidle, which stalls on long-lived trackers
+                await page.goto(page_url, wait_until="domcontentloaded", timeout=15000)
+                await page.wait_for_selector(
+                    '.m-speakers-list__items__item, [class*="speaker-item"]',
+                    timeout=5000,
+                )
+
+                # No-op after the first acceptance; accept_cookies guards
+                # on self.cookie_dismissed itself
+                await self.accept_cookies(page)
+
+                return await self.find_speaker_links(page)
+            finally:
+                await page.close()
+
     async def scrape_speakers(self) -> SpeakerCollection:
         """
         Scrape speaker information from the World Retail Congress website.
-        
+
+        Listing pages are fetched concurrently (bounded by
+        config.MAX_CONCURRENCY); the workload is network-bound, so fanning
+        out the page.goto calls is where the time goes.
+
         Returns:
             SpeakerCollection containing all scraped speakers
         """
         try:
             await self.setup_browser()
-            
-            # Process all pages of speakers
-            all_speakers = []
+
+            # Start a fresh checkpoint file for this run
+            try:
+                os.remove(config.OUTPUT_JSONL_FILE)
+            except FileNotFoundError:
+                pass
+
             speakers_processed = 0
-            speakers_since_last_enrichment = 0
-            
-            # Process pages
-            for page_num in range(1, config.MAX_PAGES + 1):
-                # Navigate to the page
-                if page_num == 1:
-                    logger.info(f"Navigating to {config.SPEAKERS_URL}")
-                    await self.page.goto(config.SPEAKERS_URL)
-                else:
-                    logger.info(f"Navigating to page {page_num}")
-                    page_url = f"{config.SPEAKERS_URL}?page={page_num}"
-                    await self.page.goto(page_url)
-                
-                await self.page.wait_for_load_state("networkidle")
-                
-                # Accept cookies if needed
-                await self.accept_cookies(self.page)
-                
-                logger.info(f"Processing page {page_num} of speakers")
-                
-                # Find all speaker links on the current page
-                speakers_on_page = await self.find_speaker_links(self.page)
-                
-                # If no speakers found on this page, break the loop
+
+            # Phase 1: enumerate every listing page and build one flat,
+            # deduped list of speaker cards. The listing pages are
+            # server-rendered, so fresh HTML is served from the on-disk
+            # cache, the misses go out in one parallel httpx batch over a
+            # shared client, and only pages whose plain fetch failed fall
+            # back to a browser navigation
+            listing_urls = [
+                config.SPEAKERS_URL if page_num == 1
+                else f"{config.SPEAKERS_URL}?page={page_num}"
+                for page_num in range(1, config.MAX_PAGES + 1)
+            ]
+            listing_html = {url: get_cached(url) for url in listing_urls}
+            misses = [url for url in listing_urls if listing_html[url] is None]
+            if misses:
+                fetched = await fetch_all_parallel(
+                    misses, concurrency=config.MAX_CONCURRENCY
+                )
+                for url, html in zip(misses, fetched):
+                    if html is not None:
+                        set_cached(url, html)
+                        listing_html[url] = html
+
+            semaphore = asyncio.Semaphore(config.MAX_CONCURRENCY)
+            listing_results = await asyncio.gather(*[
+                self.scrape_listing_page(page_num, semaphore, html=listing_html[url])
+                for page_num, url in enumerate(listing_urls, start=1)
+            ])
+
+            all_speakers = []
+            for page_num, speakers_on_page in enumerate(listing_results, start=1):
                 if not speakers_on_page:
-                    logger.info(f"No speakers found on page {page_num}, stopping")
-                    break
-                
+                    logger.info(f"No speakers found on page {page_num}, skipping")
+                    continue
+
                 logger.info(f"Found {len(speakers_on_page)} speakers on page {page_num}")
-                
-                # Process each speaker on the current page
-                for i, speaker_dict in enumerate(speakers_on_page):
-                    try:
-                        # Extract details for this speaker
-                        speaker = await self.extract_speaker_details(self.page, self.browser, speaker_dict)
-                        
-                        # Add to collection
-                        self.speaker_collection.add(speaker)
-                        
-                        # Print the extracted information
-                        logger.info(f"Successfully extracted information for {speaker.name} ({i+1}/{len(speakers_on_page)})")
-                        description_preview = speaker.description[:100] + "..." if len(speaker.description) > 100 else speaker.description
-                        logger.info(f"Description: {description_preview}")
-                        logger.info(f"Session title: {speaker.session_title}")
-                        logger.info(f"Date: {speaker.date}")
-                        logger.info(f"Time: {speaker.time}")
-                        logger.info(f"Location: {speaker.location}")
-                        
-                        # Save progress at intervals
-                        if len(self.speaker_collection.speakers) % config.SAVE_PROGRESS_INTERVAL == 0:
-                            logger.info(f"Saving progress ({len(self.speaker_collection.speakers)} speakers processed)")
-                            self.save_data(enrich_all=False)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing speaker {speaker_dict.get('name', 'Unknown')}: {e}")
-                    
-                    # Increment counters
-                    speakers_processed += 1
-                    speakers_since_last_enrichment += 1
-                    
-                    # Enrich and save data every SAVE_PROGRESS_INTERVAL speakers
-                    if speakers_since_last_enrichment >= config.SAVE_PROGRESS_INTERVAL and config.ENABLE_COMPANY_ENRICHMENT:
-                        logger.info(f"Processed {speakers_processed} speakers. Enriching data for the last {speakers_since_last_enrichment} speakers...")
-                        
-                        # Create a temporary collection with just the new speakers
-                        new_speakers = self.speaker_collection.speakers[-speakers_since_last_enrichment:]
-                        
-                        # Enrich just these speakers
-                        for speaker in new_speakers:
-                            # Skip if already enriched
-                            if (speaker.company_type not in ["Not available", ""] and
-                                speaker.company_size not in ["Not available", ""] and
-                                speaker.company_hq_country not in ["Not available", ""]):
-                                logger.info(f"Skipping speaker {speaker.name} - already enriched")
-                                continue
-                                
-                            # Skip if no company information
-                            if speaker.company == "Unknown" or speaker.company == "Not available":
-                                logger.info(f"Skipping speaker {speaker.name} - no company information available")
-                                continue
-                                
-                            # Create a single-speaker collection for enrichment
-                            temp_collection = SpeakerCollection([speaker])
-                            enrich_company_data(temp_collection, api_key=config.OPENAI_API_KEY)
-                        
-                        # Save progress
-                        self.save_data(enrich_all=False)
-                        
-                        # Reset counter
-                        speakers_since_last_enrichment = 0
-                        logger.info(f"Continuing scraping... ({speakers_processed}/{len(all_speakers) if all_speakers else 'unknown'} speakers processed)")
-            
-            logger.info(f"Processed a total of {len(self.speaker_collection.speakers)} speakers")
-            
-            # Enrich any remaining speakers and save the final data
-            if speakers_since_last_enrichment > 0 and config.ENABLE_COMPANY_ENRICHMENT:
-                logger.info(f"Processed {speakers_processed} speakers. Enriching data for the last {speakers_since_last_enrichment} speakers...")
-                
-                # Process only the new speakers that haven't been enriched yet
-                new_speakers = self.speaker_collection.speakers[-speakers_since_last_enrichment:]
-                
+
+                # Skip speakers whose detail URL (or, lacking one, whose
+                # name+company) already appeared on an earlier page
+                for speaker_dict in speakers_on_page:
+                    url = (speaker_dict.get('speakerUrl') or '').strip().rstrip('/')
+                    key = url or f"{speaker_dict.get('name', '')}|{speaker_dict.get('company', '')}"
+                    if key in self._seen_urls:
+                        logger.info(f"Skipping duplicate listing entry for {speaker_dict.get('name', 'Unknown')}")
+                        continue
+                    self._seen_urls.add(key)
+                    all_speakers.append(speaker_dict)
+
+            # Phase 2: one flat detail fan-out across every speaker, so the
+            # concurrency budget never idles between listing pages
+            logger.info(f"Dispatching detail extraction for {len(all_speakers)} speakers")
+
+            async def extract_one(speaker_dict: Dict):
+                """Pair each result (or failure) with its source card."""
+                try:
+                    return speaker_dict, await self.extract_speaker_details(speaker_dict)
+                except Exception as e:
+                    return speaker_dict, e
+
+            # Consume results as tasks finish so every record is
+            # checkpointed the moment it exists; gathering first would
+            # leave speakers.jsonl empty until the whole run completed,
+            # losing everything on an interrupt
+            for future in asyncio.as_completed(
+                [extract_one(speaker_dict) for speaker_dict in all_speakers]
+            ):
+                speaker_dict, result = await future
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing speaker {speaker_dict.get('name', 'Unknown')}: {result}")
+                    continue
+
+                speaker = result
+
+                # Add to collection
+                self.speaker_collection.add(speaker)
+
+                # Checkpoint to the append-only JSONL file; the final
+                # JSON/CSV files are only materialized once at the end
+                append_to_jsonl(speaker.to_dict(), config.OUTPUT_JSONL_FILE)
+
+                logger.info(f"Successfully extracted information for {speaker.name}")
+
+                speakers_processed += 1
+
+            self.report_progress(
+                f"Scraped {len(self.speaker_collection.speakers)} speakers"
+            )
+
+            # Enrich the scraped speakers once, off the hot path
+            if speakers_processed > 0 and config.enable_company_enrichment():
+                logger.info(f"Processed {speakers_processed} speakers. Enriching company data...")
+                new_speakers = self.speaker_collection.speakers[-speakers_processed:]
+
                 # Enrich just these speakers
                 for speaker in new_speakers:
                     # Skip if already enriched
@@ -605,18 +509,20 @@ class ScraperController:
                         speaker.company_hq_country not in ["Not available", ""]):
                         logger.info(f"Skipping speaker {speaker.name} - already enriched")
                         continue
-                        
+
                     # Skip if no company information
                     if speaker.company == "Unknown" or speaker.company == "Not available":
                         logger.info(f"Skipping speaker {speaker.name} - no company information available")
                         continue
-                        
+
                     # Create a single-speaker collection for enrichment
                     temp_collection = SpeakerCollection([speaker])
-                    enrich_company_data(temp_collection, api_key=config.OPENAI_API_KEY)
+                    enrich_company_data(temp_collection, api_key=config.get_openai_key())
+
+            logger.info(f"Processed a total of {len(self.speaker_collection.speakers)} speakers")
             
             # Save the final data (without re-enriching)
-            self.save_data(enrich_all=False)
+            await asyncio.to_thread(self.save_data, enrich_all=False)
             
             logger.info("Scraping completed successfully")
             
@@ -638,9 +544,9 @@ class ScraperController:
                         Default is False to avoid re-enriching speakers
         """
         # Enrich company data using OpenAI if enabled
-        if config.ENABLE_COMPANY_ENRICHMENT and enrich_all:
+        if config.enable_company_enrichment() and enrich_all:
             logger.info("Enriching company data with LLM (will skip already enriched speakers)...")
-            enrich_company_data(self.speaker_collection, api_key=config.OPENAI_API_KEY)
+            enrich_company_data(self.speaker_collection, api_key=config.get_openai_key())
         elif not enrich_all:
             logger.info("Skipping full enrichment as it's handled during scraping...")
         else:
@@ -673,24 +579,51 @@ class ScraperController:
 
 
 # Function to run the scraper
-async def run_scraper() -> SpeakerCollection:
+async def run_scraper(progress_queue: Optional[queue.Queue] = None) -> SpeakerCollection:
     """
     Run the scraper to collect speaker data and enrich it with company information.
-    
+
     The scraper will:
     1. Scrape speaker information from the website
     2. Enrich company data every 10 speakers (configurable via SAVE_PROGRESS_INTERVAL)
     3. Save progress regularly
     4. Return the complete collection of speakers with enriched data
-    
+
+    Args:
+        progress_queue: Optional queue that receives progress messages as
+                        speakers complete, for consumption by a UI
+
     Returns:
         SpeakerCollection containing all scraped speakers with enriched company data
     """
     logger.info("Starting scraper with integrated company data enrichment...")
     controller = ScraperController()
-    
+    controller.progress_queue = progress_queue
+
     # Scrape the speakers (this will also save the data and enrich company information)
     speaker_collection = await controller.scrape_speakers()
-    
+
     logger.info(f"Scraping and enrichment completed for {len(speaker_collection.speakers)} speakers")
-    return speaker_collection
\ No newline at end of file
+    return speaker_collection
+
+
+def start_scraper_async(progress_queue: Optional[queue.Queue] = None) -> Future:
+    """
+    Run the scraper on a single-use background thread.
+
+    Streamlit re-executes its script on every widget interaction, so the
+    long-running scrape must not block the rendering thread. The returned
+    future resolves to the SpeakerCollection; progress messages appear on
+    progress_queue as speakers complete.
+
+    Args:
+        progress_queue: Optional queue that receives progress messages
+
+    Returns:
+        Future resolving to the scraped SpeakerCollection
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper")
+    future = executor.submit(lambda: asyncio.run(run_scraper(progress_queue)))
+    # The worker thread finishes the pending job before shutdown completes
+    executor.shutdown(wait=False)
+    return future
\ No newline at end of file
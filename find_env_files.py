@@ -1,6 +1,10 @@
+import logging
+import mmap
 import os
+import re
 import sys
-import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Configure logging
@@ -10,68 +14,208 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Directories that never hold project .env/.py files; pruning them early
+# skips whole subtrees (node_modules and .venv dominate on typical checkouts)
+PRUNE_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv',
+    '.tox', 'dist', 'build', '.mypy_cache', '.pytest_cache',
+})
+
+
+def scan_tree(directory, suffixes, max_workers=8, stop=None, on_match=None):
+    """Collect files matching any of the suffixes in one threaded pass.
+
+    Directory listings block on getdents, so per-directory scans are
+    dispatched to a small thread pool and overlap: each worker scandirs
+    one directory, submits its subdirectories, and records matches. One
+    traversal serves every suffix, so each dirent is examined once. The
+    is_dir checks come from the cached dirent type instead of a stat call
+    per entry, which os.walk throws away.
+
+    os.fwalk was considered as an alternative: its dir-fd-relative *at()
+    opens save a path resolution per file, but it is a single generator
+    (no thread fan-out) and its fds only live for the current yield, so
+    they can't back the separate check phase that opens matches later.
+    The threaded scandir wins on the trees this script targets.
+
+    When a stop event is given, the traversal checks it at every
+    directory boundary and abandons pending work once it is set, so a
+    caller that finds what it wants early pays nothing for the rest of
+    the tree. on_match, if given, is called as on_match(suffix, path)
+    for each hit while the scan is still running.
+
+    Returns a dict mapping each suffix to its list of matching paths.
+    """
+    suffixes = tuple(suffixes)
+    results = {suffix: [] for suffix in suffixes}
+    lock = threading.Lock()
+
+    def scan(dirpath):
+        if stop is not None and stop.is_set():
+            return []
+        # entry.path below is assembled by the scandir C layer and only on
+        # access, so no os.path.join (or any path string) is built for
+        # entries the filters reject
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNE_DIRS:
+                            subdirs.append(entry.path)
+                    # One tuple-endswith call screens the common
+                    # non-matching entry; only hits pay the bucket loop
+                    elif entry.name.endswith(suffixes):
+                        for suffix in suffixes:
+                            if entry.name.endswith(suffix):
+                                with lock:
+                                    results[suffix].append(entry.path)
+                                if on_match is not None:
+                                    on_match(suffix, entry.path)
+                                break
+        except OSError as e:
+            logger.error("Error scanning %s: %s", dirpath, e)
+        return subdirs
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan, directory)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if stop is not None and stop.is_set():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+            for future in done:
+                for subdir in future.result():
+                    pending.add(executor.submit(scan, subdir))
+    return results
+
+
 def find_env_files(directory):
     """Find all .env files in the given directory and its subdirectories."""
-    env_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.env') or file == '.env':
-                env_path = os.path.join(root, file)
-                env_files.append(env_path)
-    return env_files
+    return scan_tree(directory, ('.env',))['.env']
+
+# Matches an OPENAI_API_KEY assignment and captures the optionally quoted
+# value; one C-level pass over the bytes replaces the per-line
+# startswith/split/strip chain
+_KEY_RE = re.compile(rb'^\s*OPENAI_API_KEY\s*=\s*["\']?([^"\'\r\n]*?)["\']?\s*$', re.M)
+
+# Pulls every line referencing the API key out of a .py file in one
+# multiline pass over the raw bytes
+_PY_LINE_RE = re.compile(rb'^.*(?:openai\.api_key|OPENAI_API_KEY).*$', re.M)
+
+
+def read_env_key(env_file):
+    """Return the OPENAI_API_KEY value from a .env file, or None.
+
+    Returns None both when no assignment is present and when the file
+    can't be read; an empty assignment comes back as ''.
+    """
+    try:
+        with open(env_file, 'rb') as f:
+            match = _KEY_RE.search(f.read())
+    except OSError as e:
+        logger.error("Error reading %s: %s", env_file, e)
+        return None
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8', errors='replace')
+
+
+def find_key(root):
+    """Return (path, key) for the first valid OPENAI_API_KEY under root.
+
+    Checks each .env file the moment the traversal discovers it and
+    stops the whole scan on the first non-empty key, so the expected
+    cost is proportional to how deep the key lives rather than to the
+    size of the tree. Returns (None, None) when no key is found.
+    """
+    found = threading.Event()
+    hit = {}
+
+    def on_match(suffix, path):
+        if found.is_set():
+            return
+        key = read_env_key(path)
+        if key:
+            hit['path'] = path
+            hit['key'] = key
+            found.set()
+
+    scan_tree(root, ('.env',), stop=found, on_match=on_match)
+    return hit.get('path'), hit.get('key')
+
 
 def check_env_file(env_file):
     """Check if the .env file contains an OpenAI API key."""
     try:
-        with open(env_file, 'r') as f:
-            content = f.read()
-            if 'OPENAI_API_KEY' in content:
-                # Extract the API key
-                for line in content.splitlines():
-                    if line.strip().startswith('OPENAI_API_KEY'):
-                        key = line.split('=')[1].strip().strip('"').strip("'")
-                        if key:
-                            masked_key = f"{key[:4]}...{key[-4:]}"
-                            logger.info(f"Found OPENAI_API_KEY in {env_file}: {masked_key}")
-                        else:
-                            logger.info(f"Found OPENAI_API_KEY in {env_file}, but it's empty")
-                        return True
-            else:
-                logger.info(f"No OPENAI_API_KEY found in {env_file}")
-                return False
+        key = read_env_key(env_file)
+        if key is None:
+            logger.info("No OPENAI_API_KEY found in %s", env_file)
+            return False
+
+        if key:
+            masked_key = f"{key[:4]}...{key[-4:]}"
+            logger.info("Found OPENAI_API_KEY in %s: %s", env_file, masked_key)
+        else:
+            logger.info("Found OPENAI_API_KEY in %s, but it's empty", env_file)
+        return True
     except Exception as e:
-        logger.error(f"Error reading {env_file}: {e}")
+        logger.error("Error reading %s: %s", env_file, e)
         return False
 
 # Get the current directory
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Find all .env files
-logger.info(f"Searching for .env files in {current_dir}...")
-env_files = find_env_files(current_dir)
+# Fast path: stop scanning as soon as one .env yields a usable key;
+# the exhaustive diagnostics below only run when nothing is found
+logger.info("Searching for OPENAI_API_KEY in %s...", current_dir)
+key_path, key = find_key(current_dir)
+if key:
+    logger.info("Found OPENAI_API_KEY in %s: %s...%s", key_path, key[:4], key[-4:])
+    sys.exit(0)
+
+# No valid key anywhere: fall back to a full scan and report every .env
+# and suspect .py file to help track down where the key should live
+# (one pass collects both suffixes)
+logger.info("No valid key found; scanning everything for diagnostics...")
+found = scan_tree(current_dir, ('.env', '.py'))
+env_files = found['.env']
 
 if env_files:
-    logger.info(f"Found {len(env_files)} .env files:")
+    logger.info("Found %d .env files:", len(env_files))
     for env_file in env_files:
-        logger.info(f"Checking {env_file}...")
+        logger.info("Checking %s...", env_file)
         check_env_file(env_file)
 else:
     logger.info("No .env files found")
 
-# Also check for any Python files that might be setting the API key
-logger.info(f"Searching for Python files that might be setting the API key...")
-for root, dirs, files in os.walk(current_dir):
-    for file in files:
-        if file.endswith('.py'):
-            py_path = os.path.join(root, file)
+# Also check for any Python files that might be setting the API key;
+# the candidates were already collected by the single pass above
+logger.info("Checking Python files that might be setting the API key...")
+for py_path in found['.py']:
+    try:
+        # mmap + bytes find rules out non-matching files without decoding
+        # or copying them; only hits pay for UTF-8 decode and line scan
+        with open(py_path, 'rb') as f:
             try:
-                with open(py_path, 'r') as f:
-                    content = f.read()
-                    if 'openai.api_key' in content and 'OPENAI_API_KEY' in content:
-                        logger.info(f"Found potential API key setting in {py_path}")
-                        # Extract the relevant lines
-                        for i, line in enumerate(content.splitlines()):
-                            if 'openai.api_key' in line or 'OPENAI_API_KEY' in line:
-                                logger.info(f"  Line {i+1}: {line.strip()}")
-            except Exception as e:
-                logger.error(f"Error reading {py_path}: {e}")
\ No newline at end of file
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file can't be mapped
+                continue
+            with mm:
+                if mm.find(b'openai.api_key') < 0 or mm.find(b'OPENAI_API_KEY') < 0:
+                    continue
+                data = mm[:]
+
+        # One C-level regex pass finds the matching lines; line numbers
+        # come from counting newlines up to each match, so the file is
+        # never decoded in full or split into a per-line list. One log
+        # record per file keeps it to one lock acquisition and write.
+        hits = []
+        for m in _PY_LINE_RE.finditer(data):
+            line_no = data.count(b'\n', 0, m.start()) + 1
+            line = m.group(0).strip().decode('utf-8', errors='replace')
+            hits.append(f"  Line {line_no}: {line}")
+        logger.info("Found potential API key setting in %s\n%s", py_path, '\n'.join(hits))
+    except Exception as e:
+        logger.error("Error reading %s: %s", py_path, e)
\ No newline at end of file
@@ -4,13 +4,66 @@ Speaker model for the World Retail Congress Speakers Scraper.
 This module defines the Speaker data model.
 """
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+# Default value for every Speaker field, mirroring the dataclass defaults;
+# from_dict merges incoming records over this in one step
+_SPEAKER_DEFAULTS = {
+    'name': 'Unknown',
+    'position': 'Unknown',
+    'company': 'Unknown',
+    'description': 'No description available',
+    'session_title': 'Not available',
+    'date': 'Not available',
+    'time': 'Not available',
+    'location': 'Not available',
+    'company_type': 'Not available',
+    'company_size': 'Not available',
+    'company_hq_address': 'Not available',
+    'company_hq_country': 'Not available',
+    'company_international': 'Not available',
+}
 
-@dataclass
+# Short categorical fields whose values repeat across most records;
+# interning them collapses duplicates to one string object each
+_INTERNED_FIELDS = (
+    'company_type',
+    'company_size',
+    'company_hq_country',
+    'company_international',
+)
+
+
+def _merge_interned(data: Dict) -> Dict:
+    """Merge a record over the defaults, interning the categorical fields.
+
+    One C-level dict merge instead of a .get call per field; unknown keys
+    are dropped rather than raising. Shared by from_dict and the
+    from_dict_list bulk loop so both ingestion paths dedupe the same way.
+    """
+    known = {key: data[key] for key in data.keys() & _SPEAKER_DEFAULTS.keys()}
+    merged = _SPEAKER_DEFAULTS | known
+    for field in _INTERNED_FIELDS:
+        value = merged[field]
+        if type(value) is str:
+            merged[field] = sys.intern(value)
+    return merged
+
+
+@dataclass(slots=True)
 class Speaker:
-    """Speaker data model."""
+    """Speaker data model.
+
+    Slotted to shrink the per-record footprint: the controller holds every
+    scraped speaker in memory until the final save, and slots cut the
+    per-instance cost by several hundred bytes while speeding up attribute
+    access. Deliberately not frozen: company enrichment fills in the
+    company_* fields in place after scraping, and the enrichment flow
+    relies on those shared references being updated (the controller wraps
+    speakers in throwaway single-item collections while enriching).
+    """
     name: str
     position: str = "Unknown"
     company: str = "Unknown"
@@ -28,58 +81,109 @@ class Speaker:
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Speaker':
-        """Create a Speaker instance from a dictionary."""
-        return cls(
-            name=data.get('name', 'Unknown'),
-            position=data.get('position', 'Unknown'),
-            company=data.get('company', 'Unknown'),
-            description=data.get('description', 'No description available'),
-            session_title=data.get('session_title', 'Not available'),
-            date=data.get('date', 'Not available'),
-            time=data.get('time', 'Not available'),
-            location=data.get('location', 'Not available'),
-            # Company enrichment fields
-            company_type=data.get('company_type', 'Not available'),
-            company_size=data.get('company_size', 'Not available'),
-            company_hq_address=data.get('company_hq_address', 'Not available'),
-            company_hq_country=data.get('company_hq_country', 'Not available'),
-            company_international=data.get('company_international', 'Not available')
-        )
+        """Create a Speaker instance from a dictionary.
+
+        Merging and interning live in _merge_interned so bulk loads
+        don't hold one string object per record for "Retail", "Yes",
+        country names, ...
+        """
+        return cls(**_merge_interned(data))
     
     def to_dict(self) -> Dict:
-        """Convert the Speaker instance to a dictionary."""
-        return asdict(self)
+        """Convert the Speaker instance to a dictionary.
+
+        Built as a plain dict literal: asdict() re-walks the dataclass
+        fields and deep-copies every value on each call, which is pure
+        overhead for a flat record of strings.
+        """
+        return {
+            'name': self.name,
+            'position': self.position,
+            'company': self.company,
+            'description': self.description,
+            'session_title': self.session_title,
+            'date': self.date,
+            'time': self.time,
+            'location': self.location,
+            'company_type': self.company_type,
+            'company_size': self.company_size,
+            'company_hq_address': self.company_hq_address,
+            'company_hq_country': self.company_hq_country,
+            'company_international': self.company_international,
+        }
 
 
 class SpeakerCollection:
-    """Collection of Speaker objects."""
-    
+    """Collection of Speaker objects.
+
+    Hybrid layout: the Speaker records themselves stay row-wise in
+    self.speakers, because enrichment and the controller mutate and share
+    them by reference, while the query hot paths scan the columnar
+    lowercase caches (_companies_lower/_dates_lower) built alongside. A
+    full struct-of-arrays store was considered and rejected — per-column
+    lists would turn every shared reference into a view that must write
+    back, for a win the scan columns already provide.
+    """
+
     def __init__(self, speakers: Optional[List[Speaker]] = None):
         """Initialize the collection with optional speakers."""
         self.speakers = speakers or []
-    
+        # Dedupe key of every speaker already in the collection
+        self._keys = {(s.name.lower(), s.company.lower()) for s in self.speakers}
+        # Lazy name -> speaker index, built on the first get_by_name call
+        self._name_index: Optional[Dict[str, Speaker]] = None
+        # Normalized company/date caches, parallel to self.speakers, so
+        # the substring queries never re-lower per call
+        self._companies_lower: List[str] = []
+        self._dates_lower: List[str] = []
+        for s in self.speakers:
+            self._cache_normalized(s, s.company.lower(), s.date.lower())
+
+    def _cache_normalized(self, speaker: Speaker, company_lower: str, date_lower: str) -> None:
+        """Record a speaker's normalized company/date in the query caches.
+
+        Takes the lowered values as arguments so callers that already
+        computed them (add's dedupe key) don't allocate them twice.
+        """
+        self._companies_lower.append(company_lower)
+        self._dates_lower.append(date_lower)
+
     def add(self, speaker: Speaker) -> None:
-        """Add a speaker to the collection."""
+        """Add a speaker to the collection, skipping name+company duplicates."""
+        # Lower each field once; the results feed the dedupe key, the
+        # query caches and the name index without re-allocation
+        name_lower = speaker.name.lower()
+        company_lower = speaker.company.lower()
+        key = (name_lower, company_lower)
+        if key in self._keys:
+            return
+        self._keys.add(key)
         self.speakers.append(speaker)
+        self._cache_normalized(speaker, company_lower, speaker.date.lower())
+        if self._name_index is not None:
+            self._name_index[name_lower] = speaker
     
     def get_all(self) -> List[Speaker]:
         """Get all speakers in the collection."""
         return self.speakers
     
     def get_by_name(self, name: str) -> Optional[Speaker]:
-        """Get a speaker by name."""
-        for speaker in self.speakers:
-            if speaker.name.lower() == name.lower():
-                return speaker
-        return None
+        """Get a speaker by name (case-insensitive, O(1) after the first call)."""
+        if self._name_index is None:
+            self._name_index = {s.name.lower(): s for s in self.speakers}
+        return self._name_index.get(name.lower())
     
     def get_by_company(self, company: str) -> List[Speaker]:
-        """Get all speakers from a specific company."""
-        return [s for s in self.speakers if company.lower() in s.company.lower()]
-    
+        """Get all speakers whose company contains the query (case-insensitive)."""
+        query = company.lower()
+        # Substring scan over the cached lowercase values
+        return [s for s, c in zip(self.speakers, self._companies_lower) if query in c]
+
     def get_by_date(self, date: str) -> List[Speaker]:
-        """Get all speakers speaking on a specific date."""
-        return [s for s in self.speakers if date.lower() in s.date.lower()]
+        """Get all speakers whose date contains the query (case-insensitive)."""
+        query = date.lower()
+        # Substring scan over the cached lowercase values
+        return [s for s, d in zip(self.speakers, self._dates_lower) if query in d]
     
     def to_dict_list(self) -> List[Dict]:
         """Convert all speakers to a list of dictionaries."""
@@ -87,6 +191,14 @@ class SpeakerCollection:
     
     @classmethod
     def from_dict_list(cls, dict_list: List[Dict]) -> 'SpeakerCollection':
-        """Create a SpeakerCollection from a list of dictionaries."""
-        speakers = [Speaker.from_dict(d) for d in dict_list]
+        """Create a SpeakerCollection from a list of dictionaries.
+
+        Bulk-ingestion hot loop: the merge helper and constructor are
+        bound to locals so each record is one merge-and-intern plus one
+        call, without re-resolving the classmethod descriptor per
+        iteration.
+        """
+        merge = _merge_interned
+        speaker_cls = Speaker
+        speakers = [speaker_cls(**merge(d)) for d in dict_list]
         return cls(speakers)
\ No newline at end of file
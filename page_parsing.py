@@ -0,0 +1,246 @@
+"""
+HTML parsing helpers for the World Retail Congress Speakers Scraper.
+
+Python-side equivalents of the in-page JavaScript extractors, built on
+selectolax (C lexbor bindings, roughly 10-20x faster than pure-Python
+parsers). Used together with async_http_helper when pages are fetched as
+plain HTML instead of rendered in a browser.
+"""
+
+import logging
+import re
+from typing import Dict, List
+
+from selectolax.parser import HTMLParser
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Extracts the speaker URL out of an openRemoteModal('...') handler
+MODAL_URL_RE = re.compile(r"openRemoteModal\('([^']+)'")
+
+# Same selectors the in-page JS extractor uses
+SPEAKER_CARD_SELECTOR = '.m-speakers-list__items__item, [class*="speaker-item"]'
+NAME_SELECTOR = 'h2, h3, h4, [class*="name"]'
+POSITION_SELECTOR = '[class*="position"], [class*="job"]'
+COMPANY_SELECTOR = '[class*="company"], [class*="organization"]'
+
+# Detail-page selectors
+SESSION_SELECTOR = '.session-title, [class*="session"], [class*="talk"], [class*="presentation"]'
+DATE_SELECTOR = '[class*="date"], [class*="time"], [class*="schedule"], time'
+VENUE_SELECTOR = '[class*="location"], [class*="venue"], [class*="place"], [class*="track"]'
+
+# Session text patterns, e.g.
+# "Sessions 13-May-2025 12:10 – 12:50 Track 2 Debate: From Traffic to Revenue"
+DATE_RE = re.compile(r"(\d{1,2})[-–]May[-–](\d{4})")
+RANGE_DATE_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s*[-–]\s*(\d{1,2})(?:st|nd|rd|th)?\s*May\s*(\d{4})?")
+TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*[–-]\s*(\d{1,2}:\d{2})")
+VENUE_RE = re.compile(r"Track\s*(\d+)|([\w\s]+Suite)")
+TITLE_RE = re.compile(r"(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\s*(.+)$")
+
+# Matches text coming from the cookie consent banner; a single compiled
+# alternation beats scanning the text once per keyword
+COOKIE_KEYWORDS = (
+    'cookie', 'consent', 'privacy', 'necessary cookies',
+    'data protection', 'gdpr', 'personal data',
+    'tracking', 'third party', 'third-party',
+)
+COOKIE_RE = re.compile('|'.join(map(re.escape, COOKIE_KEYWORDS)), re.IGNORECASE)
+
+# Common navigation/website headings that are never session content
+NAV_HEADINGS = ('About', 'Programme', 'Sponsor', 'Insights')
+
+# Session-type prefixes that mark a heading as a session title
+SESSION_TYPE_PREFIXES = ('Debate:', 'Briefing:', 'Keynote:', 'Panel:')
+
+# Words that mark an element's text as a venue
+VENUE_KEYWORDS = ('Track', 'Room', 'Hall', 'Suite', 'Stage')
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _clean_text(text: str) -> str:
+    """Collapse whitespace runs and strip, mirroring the JS cleanText."""
+    if not text:
+        return ''
+    return _WS_RE.sub(' ', text).strip()
+
+
+def _is_cookie_consent_text(text: str) -> bool:
+    """Whether the text looks like it came from the cookie banner."""
+    return bool(text) and COOKIE_RE.search(text) is not None
+
+
+def _first_text(card, selector: str, default: str = 'Unknown') -> str:
+    """Return the stripped text of the first match, or the default."""
+    node = card.css_first(selector)
+    if node is None:
+        return default
+    text = node.text(strip=True)
+    return text if text else default
+
+
+def parse_speaker_cards(html: str) -> List[Dict]:
+    """
+    Parse the speaker cards out of a listing page's HTML.
+
+    Produces the same dictionaries as the in-page JS extractor in
+    find_speaker_links: name, position, company, modalInfo, speakerUrl.
+
+    Args:
+        html: The listing page HTML
+
+    Returns:
+        List of dictionaries containing speaker information
+    """
+    tree = HTMLParser(html)
+    speakers = []
+
+    for card in tree.css(SPEAKER_CARD_SELECTOR):
+        modal_info = None
+        speaker_url = None
+
+        link = card.css_first('a')
+        if link is not None:
+            onclick = link.attributes.get('onclick')
+            href = link.attributes.get('href')
+
+            if onclick and 'openRemoteModal' in onclick:
+                modal_info = onclick
+                match = MODAL_URL_RE.search(onclick)
+                if match:
+                    speaker_url = match.group(1)
+            elif href and 'openRemoteModal' in href:
+                modal_info = href
+                match = MODAL_URL_RE.search(href)
+                if match:
+                    speaker_url = match.group(1)
+            elif href:
+                speaker_url = href
+
+        speakers.append({
+            'name': _first_text(card, NAME_SELECTOR),
+            'position': _first_text(card, POSITION_SELECTOR),
+            'company': _first_text(card, COMPANY_SELECTOR),
+            'modalInfo': modal_info,
+            'speakerUrl': speaker_url,
+        })
+
+    logger.info(f"Parsed {len(speakers)} speaker cards from HTML")
+    return speakers
+
+
+def parse_speaker_detail(html: str) -> Dict:
+    """
+    Parse a speaker detail page's HTML into the detail fields.
+
+    Python-side equivalent of the in-page JS extractor previously run via
+    page.evaluate in extract_speaker_details: longest non-cookie paragraph
+    as the description, then the session title/date/time/venue regexes.
+
+    Args:
+        html: The speaker detail page HTML
+
+    Returns:
+        Dictionary with description, session_title, date, time and
+        location — keyed to match the Speaker fields so the result can be
+        splatted straight into the constructor
+    """
+    tree = HTMLParser(html)
+
+    # Extract description - use the longest non-cookie-banner paragraph
+    description = 'No description available'
+    longest = ''
+    for p in tree.css('p'):
+        text = p.text(strip=True)
+        if len(text) > len(longest) and not _is_cookie_consent_text(text):
+            longest = text
+    if longest:
+        description = longest
+
+    session = {
+        'title': 'Not available',
+        'date': 'Not available',
+        'time': 'Not available',
+        'venue': 'Not available',
+    }
+
+    # Look for elements that might contain session information
+    for el in tree.css(SESSION_SELECTOR):
+        text = _clean_text(el.text())
+        if (text and text != 'We value your privacy'
+                and not _is_cookie_consent_text(text)):
+            match = DATE_RE.search(text)
+            if match:
+                session['date'] = f"{match.group(1)} May {match.group(2)}"
+
+            match = TIME_RE.search(text)
+            if match:
+                session['time'] = f"{match.group(1)} - {match.group(2)}"
+
+            match = VENUE_RE.search(text)
+            if match:
+                session['venue'] = match.group(0)
+
+            # Title is after "Debate:" or a similar keyword; failing that,
+            # the last colon-separated part of the text
+            match = TITLE_RE.search(text)
+            if match:
+                session['title'] = match.group(1).strip()
+            else:
+                parts = text.split(':')
+                if len(parts) > 1:
+                    session['title'] = parts[-1].strip()
+            break
+
+    # If session title not found, try other heading elements
+    if session['title'] == 'Not available':
+        for h in tree.css('h1, h2, h3, h4, h5, h6'):
+            text = _clean_text(h.text())
+            if (text
+                    and not any(nav in text for nav in NAV_HEADINGS)
+                    and 'BOOK YOUR PLACE' not in text
+                    and 'We value your privacy' not in text
+                    and not _is_cookie_consent_text(text)
+                    and any(kw in text for kw in SESSION_TYPE_PREFIXES)):
+                match = TITLE_RE.search(text)
+                session['title'] = match.group(1).strip() if match else text
+                break
+
+    # Extract date/time if not found in session info
+    if session['date'] == 'Not available' or session['time'] == 'Not available':
+        for el in tree.css(DATE_SELECTOR):
+            text = _clean_text(el.text())
+            if (text
+                    and not any(nav in text for nav in NAV_HEADINGS)
+                    and not _is_cookie_consent_text(text)):
+                match = RANGE_DATE_RE.search(text)
+                if match:
+                    session['date'] = match.group(0)
+
+                match = TIME_RE.search(text)
+                if match:
+                    session['time'] = f"{match.group(1)} - {match.group(2)}"
+                break
+
+    # If venue not found in session info, look for it separately
+    if session['venue'] == 'Not available':
+        for el in tree.css(VENUE_SELECTOR):
+            text = _clean_text(el.text())
+            if (text
+                    and any(kw in text for kw in VENUE_KEYWORDS)
+                    and not _is_cookie_consent_text(text)):
+                session['venue'] = text
+                break
+
+    # Clean up the date field
+    if '12th - 14th May 2025' in session['date']:
+        session['date'] = '12th - 14th May 2025'
+
+    return {
+        'description': description,
+        'session_title': session['title'],
+        'date': session['date'],
+        'time': session['time'],
+        'location': session['venue'],
+    }
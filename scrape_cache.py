@@ -0,0 +1,129 @@
+"""
+Disk cache for scraped page HTML.
+
+The speakers pages rarely change between dev iterations, so fetched HTML
+is memoized on disk keyed by URL with a TTL (config.CACHE_TTL_SECONDS).
+Repeated runs within the TTL skip the network entirely. Uses diskcache
+when installed, otherwise a simple one-file-per-URL fallback.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Optional
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_cache = None
+
+
+def _get_cache():
+    """Return the diskcache instance, creating it lazily."""
+    global _cache
+    if _cache is None and diskcache is not None:
+        _cache = diskcache.Cache(config.CACHE_DIR)
+    return _cache
+
+
+def _fallback_path(url: str) -> str:
+    """Path of the fallback cache file for a URL."""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(config.CACHE_DIR, f"{digest}.json")
+
+
+def get_cached(url: str) -> Optional[str]:
+    """
+    Return the cached HTML for a URL, or None if missing or stale.
+
+    Args:
+        url: The URL the HTML was fetched from
+
+    Returns:
+        The cached HTML, or None on a cache miss
+    """
+    cache = _get_cache()
+    if cache is not None:
+        entry = cache.get(url)
+    else:
+        try:
+            with open(_fallback_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            entry = None
+
+    if entry and entry["ts"] > time.time() - config.CACHE_TTL_SECONDS:
+        return entry["html"]
+    return None
+
+
+def set_cached(url: str, html: str) -> None:
+    """
+    Store the HTML fetched for a URL.
+
+    Args:
+        url: The URL the HTML was fetched from
+        html: The page HTML to cache
+    """
+    entry = {"ts": time.time(), "html": html}
+    cache = _get_cache()
+    try:
+        if cache is not None:
+            cache.set(url, entry)
+        else:
+            os.makedirs(config.CACHE_DIR, exist_ok=True)
+            with open(_fallback_path(url), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+    except Exception as e:
+        logger.warning(f"Could not cache page for {url}: {e}")
+
+
+def cached_get(url: str, fetch_fn: Callable[[], str]) -> str:
+    """
+    Return HTML for a URL, fetching and caching it on a miss.
+
+    Args:
+        url: The URL to fetch
+        fetch_fn: Zero-argument callable that fetches the HTML
+
+    Returns:
+        The page HTML (cached or freshly fetched)
+    """
+    html = get_cached(url)
+    if html is not None:
+        logger.info(f"Cache hit for {url}")
+        return html
+
+    html = fetch_fn()
+    set_cached(url, html)
+    return html
+
+
+async def cached_get_async(url: str, fetch_fn: Callable[[], Awaitable[str]]) -> str:
+    """
+    Async variant of cached_get for coroutine-based fetchers.
+
+    Args:
+        url: The URL to fetch
+        fetch_fn: Zero-argument coroutine function that fetches the HTML
+
+    Returns:
+        The page HTML (cached or freshly fetched)
+    """
+    html = get_cached(url)
+    if html is not None:
+        logger.info(f"Cache hit for {url}")
+        return html
+
+    html = await fetch_fn()
+    set_cached(url, html)
+    return html
@@ -6,17 +6,31 @@ This script scrapes speaker information from the World Retail Congress website
 using Playwright for browser automation.
 """
 
+# Keep annotations as strings so importing this module doesn't spend
+# time building typing objects at function-def time; the scraper is
+# often invoked cold from the command line or cron
+from __future__ import annotations
+
 import asyncio
 import csv
 import json
 import logging
+import operator
 import os
 import re
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
+import httpx
 from playwright.async_api import async_playwright, Page
 
-from config import BASE_URL, SPEAKERS_URL, OUTPUT_JSON_FILE, OUTPUT_CSV_FILE, GENERIC_DESCRIPTION
+try:
+    import orjson  # SIMD-accelerated JSON; ~2x faster than stdlib here
+except ImportError:
+    orjson = None
+
+from config import BASE_URL, SPEAKERS_URL, OUTPUT_JSON_FILE, OUTPUT_CSV_FILE, GENERIC_DESCRIPTION, BLOCKED_RESOURCE_TYPES, CACHE_TTL_SECONDS, ensure_data_dir
+from page_parsing import parse_speaker_cards, parse_speaker_detail
 
 # Configure logging
 logging.basicConfig(
@@ -25,94 +39,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# # Constants
-# BASE_URL = "https://www.worldretailcongress.com"
-# SPEAKERS_URL = f"{BASE_URL}/2025-speakers"
-# OUTPUT_JSON_FILE = "speakers.json"
-# OUTPUT_CSV_FILE = "speakers.csv"
-# GENERIC_DESCRIPTION = "Since 2007, World Retail Congress has been the premier platform for in-depth research, content and events; driving retail growth and inspiring valuable global connections."
+# Hosts that only serve analytics/tracking pixels; nothing the scraper
+# reads ever comes from them
+TRACKER_HOSTS = (
+    'googletagmanager.com',
+    'google-analytics.com',
+    'doubleclick.net',
+    'hotjar',
+    'facebook.net',
+)
+
+# On-disk cache of extracted detail data keyed by speaker URL; reruns
+# within the TTL skip the navigation entirely
+_CACHE_PATH = ".speaker_cache.json"
+
+# Incremental checkpoint: one JSON line per scraped speaker, flushed as
+# soon as the record is complete
+OUTPUT_NDJSON_FILE = "speakers.ndjson"
+
+
+def _json_loads(line):
+    """Decode one JSON document with the fastest available parser."""
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def _dumps_indented(record: Dict) -> str:
+    """Pretty-print one record with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(record, indent=2, ensure_ascii=False)
+
+
+def _load_detail_cache() -> Dict:
+    """Load the speaker-detail cache, dropping entries past the TTL."""
+    try:
+        with open(_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    return {url: entry for url, entry in cache.items()
+            if entry.get("cached_at", 0) > cutoff}
+
+
+def _save_detail_cache(cache: Dict) -> None:
+    """Persist the speaker-detail cache atomically."""
+    try:
+        tmp = _CACHE_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, _CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"Could not save speaker detail cache: {e}")
+
+
+# Set once the consent banner has been dismissed. Every page comes from
+# the one shared context, so the consent cookie it stores covers all
+# later navigations and the banner never reappears within a run.
+_cookies_accepted = asyncio.Event()
 
 
 async def accept_cookies(page: Page) -> None:
     """Accept cookies on the page if the cookie banner is present."""
+    if _cookies_accepted.is_set():
+        return
     try:
         # Wait for the cookie banner to appear
         logger.info("Looking for cookie consent banner...")
         
-        # Try JavaScript approach with multiple attempts
-        for attempt in range(3):
-            clicked = await page.evaluate("""
-            () => {
-                // Try multiple approaches to find and click the cookie button
-                
-                // Approach 1: Find by data-cky-tag attribute
-                const acceptButton = document.querySelector('button[data-cky-tag="accept-button"]');
-                if (acceptButton) {
-                    console.log('Found cookie button by data-cky-tag');
-                    acceptButton.click();
-                    return true;
-                }
-                
-                // Approach 2: Find by aria-label
-                const ariaButton = document.querySelector('button[aria-label="Accept All"]');
-                if (ariaButton) {
-                    console.log('Found cookie button by aria-label');
-                    ariaButton.click();
-                    return true;
-                }
-                
-                // Approach 3: Find by class
-                const classButton = document.querySelector('.cky-btn-accept');
-                if (classButton) {
-                    console.log('Found cookie button by class');
-                    classButton.click();
-                    return true;
-                }
-                
-                // Approach 4: Find any button with "Accept All" text
-                const buttons = Array.from(document.querySelectorAll('button'));
-                const acceptAllButton = buttons.find(btn => 
-                    btn.textContent.includes('Accept All')
+        # Single shot: click right away if the button already exists,
+        # otherwise a MutationObserver fires the moment it is inserted,
+        # bounded by a 2s timeout — no fixed polling rounds
+        clicked = await page.evaluate("""
+        () => new Promise((resolve) => {
+            const find = () => {
+                // Known CookieYes hooks first, then text/class fallbacks
+                const direct = document.querySelector(
+                    'button[data-cky-tag="accept-button"], .cky-btn-accept, button[aria-label="Accept All"]'
                 );
-                
-                if (acceptAllButton) {
-                    console.log('Found Accept All button by text content');
-                    acceptAllButton.click();
-                    return true;
-                }
-                
-                // Approach 5: Find any button with "Accept" text
-                const acceptButton2 = buttons.find(btn => 
-                    btn.textContent.includes('Accept') || 
+                if (direct) return direct;
+                const buttons = Array.from(document.querySelectorAll('button'));
+                return buttons.find(btn =>
+                    btn.textContent.includes('Accept') ||
                     btn.textContent.includes('accept')
-                );
-                
-                if (acceptButton2) {
-                    console.log('Found Accept button by text content');
-                    acceptButton2.click();
-                    return true;
-                }
-                
-                // Approach 6: Try clicking on any element that looks like a cookie banner button
-                const cookieBannerButtons = document.querySelectorAll('[class*="cookie"] button, [class*="consent"] button, [class*="privacy"] button');
-                if (cookieBannerButtons.length > 0) {
-                    console.log('Found cookie banner button by class pattern');
-                    cookieBannerButtons[0].click();
+                ) || document.querySelector(
+                    '[class*="cookie"] button, [class*="consent"] button, [class*="privacy"] button'
+                ) || null;
+            };
+
+            const check = () => {
+                const button = find();
+                if (button) {
+                    button.click();
+                    resolve(true);
                     return true;
                 }
-                
                 return false;
-            }
-            """)
-            
-            if clicked:
-                logger.info("Successfully clicked cookie button via JavaScript")
-                await page.wait_for_timeout(1000)
-                return
-            else:
-                logger.warning(f"Could not find cookie button via JavaScript (attempt {attempt+1}/3)")
-                await page.wait_for_timeout(1000)  # Wait a bit and try again
-        
+            };
+
+            if (check()) return;
+            const observer = new MutationObserver(() => {
+                if (check()) observer.disconnect();
+            });
+            observer.observe(document.body, { subtree: true, childList: true });
+            setTimeout(() => { observer.disconnect(); resolve(false); }, 2000);
+        })
+        """)
+
+        if clicked:
+            logger.info("Successfully clicked cookie button via JavaScript")
+            _cookies_accepted.set()
+            await page.wait_for_timeout(1000)
+            return
+        logger.warning("Cookie banner did not appear within 2s")
+
         # If we get here, we couldn't click the cookie button with JavaScript
         # Try clicking with Playwright's built-in methods
         try:
@@ -130,6 +170,7 @@ async def accept_cookies(page: Page) -> None:
                 if await page.query_selector(selector):
                     await page.click(selector)
                     logger.info(f"Successfully clicked cookie button using selector: {selector}")
+                    _cookies_accepted.set()
                     await page.wait_for_timeout(1000)
                     return
         except Exception as e:
@@ -139,7 +180,7 @@ async def accept_cookies(page: Page) -> None:
         logger.warning(f"Could not find or click cookie consent button: {e}")
 
 
-async def find_speaker_links(page: Page) -> List[Dict]:
+async def find_speaker_links(page: Page) -> Tuple[List[Dict], Optional[int]]:
     """
     Find all speaker links on the page.
     
@@ -147,17 +188,20 @@ async def find_speaker_links(page: Page) -> List[Dict]:
         page: The Playwright page object
         
     Returns:
-        List of dictionaries containing speaker information
+        Tuple of (list of speaker-card dictionaries, last page number
+        parsed from the pagination's rel="last" link, or None if the
+        listing doesn't expose one)
     """
     logger.info("Finding speaker links on the page...")
-    
-    # Get all speaker cards
-    speaker_cards = await page.evaluate("""
+
+    # Get all speaker cards plus the pagination's last-page link in the
+    # same evaluate, so pagination costs no extra round trip
+    result = await page.evaluate("""
     () => {
         // Find all speaker cards
         const speakerItems = document.querySelectorAll('.m-speakers-list__items__item, [class*="speaker-item"]');
-        
-        return Array.from(speakerItems).map(item => {
+
+        const cards = Array.from(speakerItems).map(item => {
             // Find the link, name, position, and company
             const link = item.querySelector('a');
             const nameEl = item.querySelector('h2, h3, h4, [class*="name"]');
@@ -201,390 +245,110 @@ async def find_speaker_links(page: Page) -> List[Dict]:
                 speakerUrl: speakerUrl
             };
         });
+
+        // The pagination's rel="last" link, when present, names the
+        // final page directly
+        const lastLink = document.querySelector('a[rel="last"]');
+        return { cards, lastHref: lastLink ? lastLink.href : null };
     }
     """)
-    
-    logger.info(f"Found {len(speaker_cards)} speaker cards on current page")
-    return speaker_cards
 
+    speaker_cards = result['cards']
+    last_page = None
+    last_href = result.get('lastHref')
+    if last_href:
+        match = re.search(r'[?&]page=(\d+)', last_href)
+        if match:
+            last_page = int(match.group(1))
 
-async def check_for_pagination(page: Page) -> bool:
-    """
-    Check if there are more pages of speakers.
-    
-    Args:
-        page: The Playwright page object
-        
-    Returns:
-        True if there is a next page, False otherwise
-    """
-    # Check for pagination elements
-    has_next_page = await page.evaluate("""
-    () => {
-        // Look for pagination elements at the bottom of the page
-        const paginationElements = document.querySelectorAll('.pagination, [class*="pagination"], [class*="pager"], nav[aria-label*="pagination"]');
-        
-        if (paginationElements.length === 0) {
-            console.log('No pagination elements found');
-            return false;
-        }
-        
-        // Look for "Next" or ">" links within pagination elements
-        let hasNextPage = false;
-        
-        paginationElements.forEach(pagination => {
-            const nextLinks = Array.from(pagination.querySelectorAll('a, button')).filter(el => {
-                const text = el.textContent.trim().toLowerCase();
-                return text === 'next' || 
-                       text === '>' || 
-                       text === 'next page' || 
-                       text === '→' ||
-                       el.getAttribute('aria-label')?.toLowerCase().includes('next');
-            });
-            
-            // Check if the next link is disabled
-            const isDisabled = nextLinks.some(link => 
-                link.hasAttribute('disabled') || 
-                link.classList.contains('disabled') ||
-                link.parentElement.classList.contains('disabled')
-            );
-            
-            if (nextLinks.length > 0 && !isDisabled) {
-                console.log('Found next page link in pagination');
-                hasNextPage = true;
-            }
-        });
-        
-        return hasNextPage;
-    }
-    """)
-    
-    logger.info(f"Pagination check: {'Next page available' if has_next_page else 'No more pages'}")
-    return has_next_page
+    logger.info("Found %d speaker cards on current page", len(speaker_cards))
+    return speaker_cards, last_page
 
 
-async def go_to_next_page(page: Page) -> bool:
-    """
-    Navigate to the next page of speakers.
-    
-    Args:
-        page: The Playwright page object
-        
-    Returns:
-        True if successfully navigated to the next page, False otherwise
+async def extract_speaker_details(http_client: httpx.AsyncClient, page_pool: asyncio.Queue,
+                                  speaker: Dict, detail_cache: Optional[Dict] = None) -> Dict:
     """
-    # Try to click the next page link
-    clicked = await page.evaluate("""
-    () => {
-        // Look for pagination elements at the bottom of the page
-        const paginationElements = document.querySelectorAll('.pagination, [class*="pagination"], [class*="pager"], nav[aria-label*="pagination"]');
-        
-        if (paginationElements.length === 0) {
-            console.log('No pagination elements found');
-            return false;
-        }
-        
-        // Look for "Next" or ">" links within pagination elements
-        let nextLinkClicked = false;
-        
-        paginationElements.forEach(pagination => {
-            if (nextLinkClicked) return;
-            
-            const nextLinks = Array.from(pagination.querySelectorAll('a, button')).filter(el => {
-                const text = el.textContent.trim().toLowerCase();
-                return text === 'next' || 
-                       text === '>' || 
-                       text === 'next page' || 
-                       text === '→' ||
-                       el.getAttribute('aria-label')?.toLowerCase().includes('next');
-            });
-            
-            // Check if the next link is disabled
-            const isDisabled = nextLinks.some(link => 
-                link.hasAttribute('disabled') || 
-                link.classList.contains('disabled') ||
-                link.parentElement.classList.contains('disabled')
-            );
-            
-            if (nextLinks.length > 0 && !isDisabled) {
-                console.log('Clicking next page link in pagination');
-                nextLinks[0].click();
-                nextLinkClicked = true;
-            }
-        });
-        
-        return nextLinkClicked;
-    }
-    """)
-    
-    if clicked:
-        logger.info("Clicked next page link")
-        await page.wait_for_load_state("networkidle")
-        return True
-    else:
-        logger.warning("Could not find or click next page link")
-        return False
+    Extract detailed information for a speaker from their detail page.
 
+    The detail pages are server-rendered text, so they are fetched over
+    plain HTTP and parsed with selectolax first — an order of magnitude
+    cheaper than a Chromium navigation. The browser page pool is only
+    used as a fallback when the HTTP fetch fails.
 
-async def extract_speaker_details(page: Page, browser, speaker: Dict) -> Dict:
-    """
-    Extract detailed information for a speaker by navigating to their page.
-    
     Args:
-        page: The Playwright page object
-        browser: The Playwright browser object
+        http_client: Shared keep-alive HTTP/2 client for plain fetches
+        page_pool: Queue of warm pages from the shared context; its size
+            doubles as the concurrency bound for the browser fallback
         speaker: Dictionary containing basic speaker information
-        
+        detail_cache: Optional URL-keyed cache of previously extracted
+            detail data; hits skip the fetch entirely
+
     Returns:
         Dictionary containing detailed speaker information
     """
     try:
         speaker_name = speaker['name']
-        logger.info(f"Extracting details for speaker: {speaker_name}")
-        
+        # Per-task logs are lazy %s and debug-level: hundreds of tasks
+        # formatting and fighting over the stderr lock would serialize
+        # the parallel fetches; the writer reports progress instead
+        logger.debug("Extracting details for speaker: %s", speaker_name)
+
         # Check if we have a speaker URL
         if speaker.get('speakerUrl'):
             speaker_url = speaker['speakerUrl']
-            
+
             # If the URL doesn't start with http, assume it's a relative URL
             if not speaker_url.startswith('http'):
                 speaker_url = f"{BASE_URL}/{speaker_url}"
-                
-            logger.info(f"Navigating to speaker page: {speaker_url}")
-            
-            # Open a new page for the speaker
-            speaker_page = await browser.new_page()
-            await speaker_page.goto(speaker_url)
-            await speaker_page.wait_for_load_state("networkidle")
-            
-            # Accept cookies if needed
-            await accept_cookies(speaker_page)
-            
-            # Extract detailed information with improved selectors
-            detail_data = await speaker_page.evaluate(f"""
-            () => {{
-                // Function to clean text (remove extra whitespace, newlines, etc.)
-                function cleanText(text) {{
-                    if (!text) return '';
-                    return text.replace(/\\s+/g, ' ').trim();
-                }}
-                
-                // Function to check if text is from a cookie consent banner
-                function isCookieConsentText(text) {{
-                    if (!text) return false;
-                    
-                    const cookieKeywords = [
-                        'cookie', 'consent', 'privacy', 'necessary cookies', 
-                        'data protection', 'gdpr', 'personal data', 
-                        'tracking', 'third party', 'third-party'
-                    ];
-                    
-                    const lowerText = text.toLowerCase();
-                    return cookieKeywords.some(keyword => lowerText.includes(keyword.toLowerCase()));
-                }}
-                
-                // Function to check if text is the generic description
-                function isGenericDescription(text) {{
-                    if (!text) return false;
-                    
-                    const genericDesc = "{GENERIC_DESCRIPTION}";
-                    return text.includes(genericDesc);
-                }}
-                
-                // Extract description - look for paragraphs
-                let description = 'No description available';
-                const paragraphs = document.querySelectorAll('p');
-                if (paragraphs.length > 0) {{
-                    // Use the longest paragraph as the description
-                    let longestText = '';
-                    for (const p of paragraphs) {{
-                        const text = p.textContent.trim();
-                        // Skip cookie consent text and generic description
-                        if (text.length > longestText.length && 
-                            !isCookieConsentText(text) && 
-                            !isGenericDescription(text)) {{
-                            longestText = text;
-                        }}
-                    }}
-                    if (longestText) {{
-                        description = longestText;
-                    }}
-                }}
-                
-                // Extract session information
-                let sessionInfo = {{
-                    title: 'Not available',
-                    date: 'Not available',
-                    time: 'Not available',
-                    venue: 'Not available'
-                }};
-                
-                // Look for elements that might contain session information
-                const sessionElements = document.querySelectorAll('.session-title, [class*="session"], [class*="talk"], [class*="presentation"]');
-                for (const el of sessionElements) {{
-                    const text = cleanText(el.textContent);
-                    if (text && text.length > 0 && 
-                        text !== 'We value your privacy' && 
-                        !isCookieConsentText(text)) {{
-                        
-                        // Try to parse the session information
-                        // Example format: "Sessions 13-May-2025 12:10 – 12:50 Track 2 Debate: From Traffic to Revenue: Unlock Platform Success with Retail Media"
-                        
-                        // Extract date
-                        const dateMatch = text.match(/(\\d{{1,2}})[-–]May[-–](\\d{{4}})/);
-                        if (dateMatch) {{
-                            sessionInfo.date = `${{dateMatch[1]}} May ${{dateMatch[2]}}`;
-                        }}
-                        
-                        // Extract time
-                        const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[–-]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                        if (timeMatch) {{
-                            sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                        }}
-                        
-                        // Extract venue (Track or Suite)
-                        const venueMatch = text.match(/Track\\s*(\\d+)|([\\w\\s]+Suite)/);
-                        if (venueMatch) {{
-                            sessionInfo.venue = venueMatch[0];
-                        }}
-                        
-                        // Extract title - assume it's after "Debate:" or similar keywords
-                        const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                        if (titleMatch) {{
-                            sessionInfo.title = titleMatch[1].trim();
-                        }} else {{
-                            // If no specific keyword, just use the last part of the text
-                            const parts = text.split(':');
-                            if (parts.length > 1) {{
-                                sessionInfo.title = parts[parts.length - 1].trim();
-                            }}
-                        }}
-                        
-                        break;
-                    }}
-                }}
-                
-                // If session title not found, try other heading elements
-                if (sessionInfo.title === 'Not available') {{
-                    const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
-                    for (const h of headings) {{
-                        const text = cleanText(h.textContent);
-                        // Skip common navigation/website headings and cookie consent text
-                        if (text && text.length > 0 && 
-                            !text.includes('About') && 
-                            !text.includes('Programme') && 
-                            !text.includes('Sponsor') && 
-                            !text.includes('Insights') &&
-                            !text.includes('BOOK YOUR PLACE') &&
-                            !text.includes('We value your privacy') &&
-                            !isCookieConsentText(text)) {{
-                            
-                            // Check if it's a session title
-                            if (text.includes('Debate:') || 
-                                text.includes('Briefing:') || 
-                                text.includes('Keynote:') || 
-                                text.includes('Panel:')) {{
-                                
-                                // Extract the title part
-                                const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                                if (titleMatch) {{
-                                    sessionInfo.title = titleMatch[1].trim();
-                                }} else {{
-                                    sessionInfo.title = text;
-                                }}
-                                break;
-                            }}
-                        }}
-                    }}
-                }}
-                
-                // Extract date/time if not found in session info
-                if (sessionInfo.date === 'Not available' || sessionInfo.time === 'Not available') {{
-                    const dateElements = document.querySelectorAll('[class*="date"], [class*="time"], [class*="schedule"], time');
-                    for (const el of dateElements) {{
-                        const text = cleanText(el.textContent);
-                        if (text && text.length > 0 && 
-                            !text.includes('About') && 
-                            !text.includes('Programme') && 
-                            !text.includes('Sponsor') && 
-                            !text.includes('Insights') &&
-                            !isCookieConsentText(text)) {{
-                            
-                            // Extract date
-                            const dateMatch = text.match(/(\\d{{1,2}})(?:st|nd|rd|th)?\\s*[-–]\\s*(\\d{{1,2}})(?:st|nd|rd|th)?\\s*May\\s*(\\d{{4}})?/);
-                            if (dateMatch) {{
-                                sessionInfo.date = dateMatch[0];
-                            }}
-                            
-                            // Extract time
-                            const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[-–]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                            if (timeMatch) {{
-                                sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                            }}
-                            
-                            break;
-                        }}
-                    }}
-                }}
-                
-                // If venue not found in session info, look for it separately
-                if (sessionInfo.venue === 'Not available') {{
-                    const venueElements = document.querySelectorAll('[class*="location"], [class*="venue"], [class*="place"], [class*="track"]');
-                    for (const el of venueElements) {{
-                        const text = cleanText(el.textContent);
-                        if (text && text.length > 0 && 
-                            (text.includes('Track') || 
-                             text.includes('Room') || 
-                             text.includes('Hall') || 
-                             text.includes('Suite') ||
-                             text.includes('Stage')) &&
-                            !isCookieConsentText(text)) {{
-                            sessionInfo.venue = text;
-                            break;
-                        }}
-                    }}
-                    
-                    // If still not found, look for location keywords
-                    if (sessionInfo.venue === 'Not available') {{
-                        const allElements = document.querySelectorAll('*');
-                        for (const el of allElements) {{
-                            const text = cleanText(el.textContent);
-                            if ((text.includes('Track') || 
-                                text.includes('Room') || 
-                                text.includes('Hall') || 
-                                text.includes('Suite') ||
-                                text.includes('Stage')) &&
-                                !isCookieConsentText(text)) {{
-                                
-                                // Extract just the venue part
-                                const venueMatch = text.match(/Track\\s*(\\d+)|([\\w\\s]+Suite)/);
-                                if (venueMatch) {{
-                                    sessionInfo.venue = venueMatch[0];
-                                    break;
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-                
-                // Clean up the date field
-                if (sessionInfo.date.includes('12th - 14th May 2025')) {{
-                    sessionInfo.date = '12th - 14th May 2025';
-                }}
-                
-                return {{
-                    description,
-                    session_title: sessionInfo.title,
-                    date: sessionInfo.date,
-                    time: sessionInfo.time,
-                    venue: sessionInfo.venue
-                }};
-            }}
-            """)
-            
-            # Close the speaker page
-            await speaker_page.close()
-            
+
+            cached = detail_cache.get(speaker_url) if detail_cache is not None else None
+            if cached is not None:
+                logger.debug("Detail cache hit for %s", speaker_url)
+                detail_data = cached['detail']
+            else:
+                # Try the cheap path first: plain HTTP over the shared
+                # keep-alive client, parsed Python-side
+                html = None
+                try:
+                    response = await http_client.get(speaker_url)
+                    response.raise_for_status()
+                    html = response.text
+                except httpx.HTTPError as e:
+                    logger.warning("HTTP fetch failed for %s: %s", speaker_url, e)
+
+                if html is not None:
+                    detail_data = parse_speaker_detail(html)
+                else:
+                    logger.info("Falling back to browser for: %s", speaker_url)
+
+                    # Borrow a warm page from the pool; blocks until one is free
+                    speaker_page = await page_pool.get()
+                    try:
+                        await speaker_page.goto(speaker_url)
+                        # Wait for the content we actually read instead of
+                        # networkidle, which stalls on analytics beacons
+                        await speaker_page.wait_for_selector("p", state="attached", timeout=5000)
+
+                        # Consent was already accepted on the listing page and
+                        # lives in the shared context's cookies, so no banner
+                        # handling is needed here
+
+                        # Grab the rendered HTML; the parsing itself runs
+                        # Python-side on module-level compiled regexes, so
+                        # nothing gets recompiled in V8 per page
+                        html = await speaker_page.content()
+                    finally:
+                        # Return the page for the next speaker instead of closing
+                        await page_pool.put(speaker_page)
+
+                    detail_data = parse_speaker_detail(html)
+
+                if detail_cache is not None:
+                    detail_cache[speaker_url] = {
+                        'cached_at': time.time(),
+                        'detail': detail_data,
+                    }
+
             # Combine basic and detailed information
             return {
                 'name': speaker_name,
@@ -594,10 +358,10 @@ async def extract_speaker_details(page: Page, browser, speaker: Dict) -> Dict:
                 'session_title': detail_data.get('session_title', 'Not available'),
                 'date': detail_data.get('date', 'Not available'),
                 'time': detail_data.get('time', 'Not available'),
-                'location': detail_data.get('venue', 'Not available')
+                'location': detail_data.get('location', 'Not available')
             }
         else:
-            logger.warning(f"No speaker URL found for {speaker_name}")
+            logger.warning("No speaker URL found for %s", speaker_name)
             return {
                 'name': speaker_name,
                 'position': speaker.get('position', 'Unknown'),
@@ -610,7 +374,7 @@ async def extract_speaker_details(page: Page, browser, speaker: Dict) -> Dict:
             }
         
     except Exception as e:
-        logger.error(f"Error extracting details for speaker: {e}")
+        logger.error("Error extracting details for speaker: %s", e)
         return {
             'name': speaker['name'],
             'position': speaker.get('position', 'Unknown'),
@@ -623,38 +387,81 @@ async def extract_speaker_details(page: Page, browser, speaker: Dict) -> Dict:
         }
 
 
-def save_to_csv(data: List[Dict], filename: str) -> None:
+def _load_scraped_keys() -> set:
+    """Name+company keys of records already checkpointed in the NDJSON.
+
+    Lets an interrupted run resume without re-scraping: speakers whose
+    records are already on disk are skipped entirely.
     """
-    Save data to a CSV file.
-    
+    keys = set()
+    try:
+        with open(OUTPUT_NDJSON_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                except (json.JSONDecodeError, ValueError):
+                    # Truncated last line from a crash mid-write
+                    continue
+                keys.add((record.get('name'), record.get('company')))
+    except FileNotFoundError:
+        pass
+    return keys
+
+
+def _convert_ndjson(json_filename: str, csv_filename: str) -> int:
+    """Turn the NDJSON checkpoint into the final JSON and CSV outputs.
+
+    Single streaming pass: each line is decoded once and written to both
+    outputs immediately, so memory stays flat regardless of how many
+    speakers were scraped. Returns the number of records converted.
+    """
+    count = 0
+    writer = None
+    get_fields = None
+    with open(OUTPUT_NDJSON_FILE, "r", encoding="utf-8") as src, \
+         open(json_filename, "w", encoding="utf-8") as json_file, \
+         open(csv_filename, 'w', newline='', encoding='utf-8') as csv_file:
+        json_file.write('[\n')
+        for line in src:
+            try:
+                record = _json_loads(line)
+            except (json.JSONDecodeError, ValueError):
+                continue
+            if writer is None:
+                # Plain csv.writer with a precomputed itemgetter: the
+                # column layout is fixed, so there is no need for
+                # DictWriter's per-row fieldname lookups
+                fieldnames = list(record)
+                writer = csv.writer(csv_file)
+                writer.writerow(fieldnames)
+                get_fields = operator.itemgetter(*fieldnames)
+            if count:
+                json_file.write(',\n')
+            json_file.write(_dumps_indented(record))
+            writer.writerow(get_fields(record))
+            count += 1
+        json_file.write('\n]\n')
+    return count
+
+
+async def main(max_concurrency: int = 5):
+    """Main function to run the scraper.
+
     Args:
-        data: List of dictionaries containing the data
-        filename: Name of the CSV file to save to
+        max_concurrency: How many speaker detail pages to fetch at once
     """
-    if not data:
-        logger.warning("No data to save to CSV")
-        return
-    
-    try:
-        logger.info(f"Saving {len(data)} records to {filename}")
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            # Get field names from the first dictionary
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Write data rows
-            writer.writerows(data)
-            
-        logger.info(f"Successfully saved data to {filename}")
-    except Exception as e:
-        logger.error(f"Error saving data to CSV: {e}")
+    # Make sure the output directory exists before any progress saves
+    ensure_data_dir()
 
+    # Shared keep-alive HTTP/2 client for the plain-HTML detail fetches;
+    # one connection pool serves every speaker
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
 
-async def main():
-    """Main function to run the scraper."""
     async with async_playwright() as p:
         # Launch browser in headless mode with a larger viewport
         browser = await p.chromium.launch(headless=True)
@@ -663,93 +470,211 @@ async def main():
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080}
         )
-        
+
+        # The scraper only reads DOM text, so abort the heavy resource
+        # classes (images, fonts, media, stylesheets) and known tracker
+        # hosts before they ever hit the wire
+        async def _block(route):
+            request = route.request
+            if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                    or any(host in request.url for host in TRACKER_HOSTS)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _block)
+
         # Create a page from the context
         page = await context.new_page()
-        
-        # Process all pages of speakers
-        all_speakers = []
-        
-        # Hardcoded to process 2 pages since we know there are 2 pages
-        for page_num in range(1, 3):  # Process pages 1 and 2
-            # Navigate to the page
-            if page_num == 1:
-                logger.info(f"Navigating to {SPEAKERS_URL}")
-                await page.goto(SPEAKERS_URL)
-            else:
-                logger.info(f"Navigating to page {page_num}")
-                page_url = f"{SPEAKERS_URL}?page={page_num}"
-                await page.goto(page_url)
-            
-            await page.wait_for_load_state("networkidle")
-            
-            # Accept cookies if needed
-            await accept_cookies(page)
-            
-            logger.info(f"Processing page {page_num} of speakers")
-            
-            # Find all speaker links on the current page
-            speakers_on_page = await find_speaker_links(page)
-            
-            # If no speakers found on this page, break the loop
-            if not speakers_on_page:
-                logger.info(f"No speakers found on page {page_num}, stopping")
-                break
-            
-            logger.info(f"Found {len(speakers_on_page)} speakers on page {page_num}")
-            
-            # Process each speaker on the current page
-            for i, speaker in enumerate(speakers_on_page):
+
+        # Records from an interrupted run are already in the NDJSON
+        # checkpoint; skip them and append new ones to the same file
+        scraped_keys = _load_scraped_keys()
+        if scraped_keys:
+            logger.info(f"Resuming: {len(scraped_keys)} speakers already checkpointed")
+        total_speakers = len(scraped_keys)
+        # Binary mode when orjson is available, since it encodes to bytes
+        if orjson is not None:
+            ndjson_file = open(OUTPUT_NDJSON_FILE, "ab")
+        else:
+            ndjson_file = open(OUTPUT_NDJSON_FILE, "a", encoding="utf-8")
+
+        # Completed records flow through this queue to a single writer
+        # task, so scrubbing and serialization overlap with the fetches
+        # still in flight instead of waiting for the whole batch
+        writer_queue = asyncio.Queue()
+
+        async def write_records():
+            nonlocal total_speakers
+            while True:
+                speaker_details = await writer_queue.get()
+                if speaker_details is None:
+                    return
                 try:
-                    # Extract details for this speaker
-                    speaker_details = await extract_speaker_details(page, browser, speaker)
-                    
                     # Skip if the description contains cookie consent text
                     if "cookie" in speaker_details['description'].lower() or "consent" in speaker_details['description'].lower():
-                        logger.warning(f"Cookie consent text found for {speaker['name']}, replacing with 'No description available'")
+                        logger.warning("Cookie consent text found for %s, replacing with 'No description available'", speaker_details['name'])
                         speaker_details['description'] = "No description available"
-                    
+
                     # Check if the description is the generic one
                     if GENERIC_DESCRIPTION in speaker_details['description']:
-                        logger.warning(f"Generic description found for {speaker['name']}, replacing with 'No description available'")
+                        logger.warning("Generic description found for %s, replacing with 'No description available'", speaker_details['name'])
                         speaker_details['description'] = "No description available"
-                    
-                    all_speakers.append(speaker_details)
-                    
-                    # Print the extracted information
-                    logger.info(f"Successfully extracted information for {speaker['name']} ({i+1}/{len(speakers_on_page)})")
-                    description_preview = speaker_details['description'][:100] + "..." if len(speaker_details['description']) > 100 else speaker_details['description']
-                    logger.info(f"Description: {description_preview}")
-                    logger.info(f"Session title: {speaker_details['session_title']}")
-                    logger.info(f"Date: {speaker_details['date']}")
-                    logger.info(f"Time: {speaker_details['time']}")
-                    logger.info(f"Location: {speaker_details['location']}")
-                    
-                    # Save progress every 10 speakers
-                    if len(all_speakers) % 10 == 0:
-                        logger.info(f"Saving progress ({len(all_speakers)} speakers processed)")
-                        with open(OUTPUT_JSON_FILE, "w", encoding="utf-8") as f:
-                            json.dump(all_speakers, indent=2, ensure_ascii=False, fp=f)
-                        save_to_csv(all_speakers, OUTPUT_CSV_FILE)
-                    
+
+                    # Checkpoint the record immediately: one flushed JSON
+                    # line per speaker, so a crash loses nothing
+                    if orjson is not None:
+                        ndjson_file.write(orjson.dumps(speaker_details, option=orjson.OPT_APPEND_NEWLINE))
+                    else:
+                        ndjson_file.write(json.dumps(speaker_details, separators=(",", ":"), ensure_ascii=False) + "\n")
+                    ndjson_file.flush()
+                    scraped_keys.add((speaker_details['name'], speaker_details['company']))
+                    total_speakers += 1
+
+                    # One aggregated line per record; the field dump only
+                    # formats when debug logging is actually on
+                    logger.info("Completed %s (%d total)", speaker_details['name'], total_speakers)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Description: %.100s | Session: %s | Date: %s | Time: %s | Location: %s",
+                            speaker_details['description'],
+                            speaker_details['session_title'],
+                            speaker_details['date'],
+                            speaker_details['time'],
+                            speaker_details['location'],
+                        )
+
+                    # Save the detail cache every 10 speakers; the records
+                    # themselves are already safe in the NDJSON
+                    if total_speakers % 10 == 0:
+                        logger.info("Progress: %d speakers checkpointed", total_speakers)
+                        _save_detail_cache(detail_cache)
+
                 except Exception as e:
-                    logger.error(f"Error processing speaker {speaker['name']}: {e}")
-        
-        logger.info(f"Processed a total of {len(all_speakers)} speakers across {page_num} pages")
-        
-        # Save the final data to JSON and CSV files
-        logger.info(f"Saving {len(all_speakers)} speakers to {OUTPUT_JSON_FILE}")
-        with open(OUTPUT_JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(all_speakers, indent=2, ensure_ascii=False, fp=f)
-        
-        # Save to CSV
-        save_to_csv(all_speakers, OUTPUT_CSV_FILE)
+                    logger.error("Error processing speaker %s: %s", speaker_details.get('name'), e)
+
+        writer_task = asyncio.create_task(write_records())
+
+        # Fixed pool of warm pages: cold new_page calls cost several
+        # hundred ms each, while pooled pages keep their renderer and the
+        # HTTP/2 connection to the origin across navigations. Checking a
+        # page out of the queue is also what bounds the concurrency.
+        page_pool = asyncio.Queue()
+        for _ in range(max_concurrency):
+            await page_pool.put(await context.new_page())
+
+        # Details extracted on previous runs, keyed by speaker URL
+        detail_cache = _load_detail_cache()
+        if detail_cache:
+            logger.info(f"Loaded {len(detail_cache)} cached speaker details")
         
+        # Only page 1 is rendered in the browser (it also hosts the
+        # cookie banner); its rel="last" link gives the page count,
+        # falling back to the known two pages when absent
+        logger.info(f"Navigating to {SPEAKERS_URL}")
+        await page.goto(SPEAKERS_URL)
+
+        # The speaker cards are all the listing code reads, so wait
+        # for them instead of networkidle's 500ms-of-silence window
+        await page.wait_for_selector(
+            '.m-speakers-list__items__item, [class*="speaker-item"]',
+            state="attached", timeout=5000,
+        )
+
+        # Accept cookies if needed
+        await accept_cookies(page)
+
+        first_page_speakers, detected_last = await find_speaker_links(page)
+        last_page = detected_last or 2
+        if detected_last:
+            logger.info(f"Listing reports {last_page} pages")
+
+        pages_of_speakers = [first_page_speakers]
+        if last_page > 1:
+            # The remaining listing pages are plain HTML: fetch them all
+            # in one evaluate over the browser's keep-alive connection
+            # and parse them Python-side, instead of paying a full
+            # navigation and evaluate per page
+            urls = [f"{SPEAKERS_URL}?page={n}" for n in range(2, last_page + 1)]
+            logger.info(f"Fetching listing pages 2-{last_page} in one batch")
+            html_pages = await page.evaluate(
+                """async (urls) => {
+                    return await Promise.all(
+                        urls.map(u => fetch(u).then(r => r.text()))
+                    );
+                }""",
+                urls,
+            )
+            pages_of_speakers.extend(parse_speaker_cards(html) for html in html_pages)
+
+        # Speaker URLs dispatched so far this run; the same speaker can
+        # appear on several cards or straddle pages, and scraping the
+        # duplicates would only burn fetches and pollute the cache
+        seen_urls = set()
+
+        for page_num, speakers_on_page in enumerate(pages_of_speakers, start=1):
+            logger.info(f"Processing page {page_num} of speakers")
+
+            # If no speakers found on this page, stop
+            if not speakers_on_page:
+                logger.info(f"No speakers found on page {page_num}, stopping")
+                break
+
+            logger.info(f"Found {len(speakers_on_page)} speakers on page {page_num}")
+
+            # Drop duplicate cards and speakers already checkpointed
+            new_speakers = []
+            for s in speakers_on_page:
+                url = s.get('speakerUrl')
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                if (s.get('name'), s.get('company')) in scraped_keys:
+                    continue
+                new_speakers.append(s)
+            if len(new_speakers) < len(speakers_on_page):
+                logger.info(f"Skipping {len(speakers_on_page) - len(new_speakers)} duplicate or already-scraped speakers")
+
+            # Fetch every speaker on the page concurrently and hand each
+            # record to the writer the moment it completes; no gather
+            # barrier holds finished records back from the checkpoint
+            tasks = [extract_speaker_details(http_client, page_pool, speaker, detail_cache)
+                     for speaker in new_speakers]
+            for coro in asyncio.as_completed(tasks):
+                speaker_details = await coro
+                await writer_queue.put(speaker_details)
+
+        # Let the writer drain, then release the checkpoint file
+        await writer_queue.put(None)
+        await writer_task
+        ndjson_file.close()
+
+        logger.info(f"Processed a total of {total_speakers} speakers across {page_num} pages")
+
+        # One streaming pass converts the checkpoint into the final outputs
+        converted = _convert_ndjson(OUTPUT_JSON_FILE, OUTPUT_CSV_FILE)
+        logger.info(f"Saved {converted} speakers to {OUTPUT_JSON_FILE} and {OUTPUT_CSV_FILE}")
+
+        # Persist the detail cache so the next run skips the navigations
+        _save_detail_cache(detail_cache)
+
         logger.info("Scraping completed successfully")
-        
-        # Close the browser
+
+        # Close the pooled pages, then the browser and HTTP client
+        while not page_pool.empty():
+            await (await page_pool.get()).close()
         await browser.close()
 
+    await http_client.aclose()
+
 
 if __name__ == "__main__":
+    # Use uvloop when available for faster asyncio I/O (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file
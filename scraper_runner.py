@@ -34,4 +34,12 @@ async def main():
     logger.info("Scraper and enrichment process completed")
 
 if __name__ == "__main__":
+    # Use uvloop when available: the scrape is gather-heavy asyncio, and the
+    # faster loop directly reduces wall time. Not available on Windows.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file
@@ -7,19 +7,38 @@ using Playwright for browser automation.
 """
 
 import asyncio
+import csv
+import json
 import logging
 import os
+import re
 from typing import Dict, List
 
+import httpx
 from dotenv import load_dotenv
+
+try:
+    import orjson  # C serializer, 2-5x faster than stdlib for our payloads
+except ImportError:
+    orjson = None
+
+try:
+    import psutil  # Only needed for adaptive concurrency tuning
+except ImportError:
+    psutil = None
 from playwright.async_api import async_playwright
 
-from config import SPEAKERS_URL
-from src.speaker import extract_speaker_details
+from config import OUTPUT_CSV_FILE, OUTPUT_JSONL_FILE, SPEAKERS_URL, ensure_data_dir
+from page_parsing import parse_speaker_cards
+from src.speaker import (
+    AdaptiveSemaphore,
+    ContextPool,
+    extract_speaker_details,
+    _block_heavy_resources,
+)
 from src.utils import (
     accept_cookies,
     find_speaker_links,
-    save_to_csv,
     save_to_json,
     GENERIC_DESCRIPTION
 )
@@ -34,6 +53,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Suppress per-CDP-message chatter on the hot path
+logging.getLogger("playwright").setLevel(logging.WARNING)
+
+
+# Streamed checkpoints are flushed to disk once per this many records
+FLUSH_EVERY = 10
+
+# One case-insensitive scan replaces the per-keyword lower()+in checks
+_COOKIE_RE = re.compile(r"cookie|consent", re.I)
+
+# Memory budget for the browser process tree; the tuner widens the
+# extraction window while comfortably under it and shrinks above it
+RSS_BUDGET_BYTES = 1536 * 1024 * 1024
+TUNE_INTERVAL = 15.0
+
+
+async def _tune_concurrency(sem: AdaptiveSemaphore, pool: ContextPool) -> None:
+    """Steer the extraction cap around Chromium's actual memory use.
+
+    Playwright launches the browser as children of this process, so the
+    tree's RSS is the sum over psutil children. Over budget: lower the
+    cap one step and force the pool to replace its contexts on their
+    next checkout. Under three quarters of budget: raise it one step.
+    A fixed cap either wastes headroom on large hosts or OOMs small
+    ones; this keeps the crawl at whatever this host can carry.
+    """
+    proc = psutil.Process()
+    while True:
+        await asyncio.sleep(TUNE_INTERVAL)
+        try:
+            rss = sum(
+                child.memory_info().rss
+                for child in proc.children(recursive=True)
+            )
+        except psutil.Error:
+            continue
+        if rss > RSS_BUDGET_BYTES:
+            await sem.set_cap(sem.cap - 1)
+            pool.recycle()
+            logger.warning(
+                "Browser RSS %.0f MiB over budget; extraction cap lowered to %d",
+                rss / (1 << 20), sem.cap,
+            )
+        elif rss < RSS_BUDGET_BYTES * 3 // 4:
+            await sem.set_cap(sem.cap + 1)
+
 
 async def main():
     """Main function to run the scraper."""
@@ -45,34 +110,87 @@ async def main():
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080}
         )
-        
+
+        # Drop heavy resources and trackers for the listing navigation
+        # too; registered once on the context, never per page
+        await context.route("**/*", _block_heavy_resources)
+
         # Create a page from the context
         page = await context.new_page()
-        
+
+        # Pooled contexts for the speaker pages; rotated periodically so
+        # browser memory stays flat over long runs
+        pool = ContextPool(browser, size=4, viewport={'width': 1920, 'height': 1080})
+        await pool.start()
+
+        # The detail pages are server-rendered, so they are fetched over
+        # plain HTTP and parsed in-process; the pooled browser contexts
+        # only serve as the fallback when a fetch fails
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32),
+            follow_redirects=True,
+        )
+
         # Process all pages of speakers
         all_speakers = []
-        
+
+        # Streaming checkpoint writers, opened once for the run: one
+        # NDJSON line and one CSV row per speaker makes checkpointing
+        # O(1) per record instead of rewriting the whole growing list
+        ensure_data_dir()
+        if orjson is not None:
+            ndjson_file = open(OUTPUT_JSONL_FILE, "wb")
+        else:
+            ndjson_file = open(OUTPUT_JSONL_FILE, "w", encoding="utf-8")
+        csv_file = open(OUTPUT_CSV_FILE, "w", newline="", encoding="utf-8")
+        csv_writer = None  # created on the first record, once fields are known
+
+        # Bounds concurrent speaker extractions; starts conservatively and
+        # the tuner task moves the cap with the browser's memory use
+        sem = AdaptiveSemaphore(4, max_value=8)
+        tuner_task = None
+        if psutil is not None:
+            tuner_task = asyncio.create_task(_tune_concurrency(sem, pool))
+
+        async def _one(sp: Dict) -> Dict:
+            async with sem:
+                return await extract_speaker_details(page, pool, sp, http_client)
+
+
+        # The browser only visits page 1; the remaining listing pages are
+        # fetched over plain HTTP in one concurrent batch and parsed
+        # in-process, so their cost is one network roundtrip instead of a
+        # navigation each
+        logger.info(f"Navigating to {SPEAKERS_URL}")
+        await page.goto(SPEAKERS_URL, wait_until="domcontentloaded")
+
+        # Wait for the speaker cards themselves; networkidle would sit
+        # out the site's analytics beacons for no extraction benefit
+        await page.wait_for_selector(
+            '.m-speakers-list__items__item, [class*="speaker-item"]', timeout=10000
+        )
+
+        # Accept cookies if needed
+        await accept_cookies(page)
+
+        speakers_by_page = [await find_speaker_links(page)]
+
         # Hardcoded to process 2 pages since we know there are 2 pages
-        for page_num in range(1, 3):  # Process pages 1 and 2
-            # Navigate to the page
-            if page_num == 1:
-                logger.info(f"Navigating to {SPEAKERS_URL}")
-                await page.goto(SPEAKERS_URL)
-            else:
-                logger.info(f"Navigating to page {page_num}")
-                page_url = f"{SPEAKERS_URL}?page={page_num}"
-                await page.goto(page_url)
-            
-            await page.wait_for_load_state("networkidle")
-            
-            # Accept cookies if needed
-            await accept_cookies(page)
-            
+        listing_urls = [f"{SPEAKERS_URL}?page={n}" for n in range(2, 3)]
+        responses = await asyncio.gather(
+            *(http_client.get(url) for url in listing_urls),
+            return_exceptions=True,
+        )
+        for url, response in zip(listing_urls, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"Error fetching listing page {url}: {response}")
+                continue
+            speakers_by_page.append(parse_speaker_cards(response.text))
+
+        for page_num, speakers_on_page in enumerate(speakers_by_page, start=1):
             logger.info(f"Processing page {page_num} of speakers")
-            
-            # Find all speaker links on the current page
-            speakers_on_page = await find_speaker_links(page)
-            
+
             # If no speakers found on this page, break the loop
             if not speakers_on_page:
                 logger.info(f"No speakers found on page {page_num}, stopping")
@@ -80,51 +198,82 @@ async def main():
             
             logger.info(f"Found {len(speakers_on_page)} speakers on page {page_num}")
             
-            # Process each speaker on the current page
-            for i, speaker in enumerate(speakers_on_page):
+            # Extract every speaker on the page concurrently; failures
+            # come back as exceptions instead of aborting the batch
+            results = await asyncio.gather(
+                *[_one(speaker) for speaker in speakers_on_page],
+                return_exceptions=True,
+            )
+
+            # Process the results in page order; per-speaker details are
+            # collected and emitted as one log record per page batch so
+            # the hot loop pays for one format + write, not seven each
+            batch_summaries = []
+            for speaker, speaker_details in zip(speakers_on_page, results):
+                if isinstance(speaker_details, BaseException):
+                    logger.error(f"Error processing speaker {speaker['name']}: {speaker_details}")
+                    continue
                 try:
-                    # Extract details for this speaker
-                    speaker_details = await extract_speaker_details(page, browser, speaker)
-                    
                     # Skip if the description contains cookie consent text
-                    if "cookie" in speaker_details['description'].lower() or "consent" in speaker_details['description'].lower():
+                    if _COOKIE_RE.search(speaker_details['description']):
                         logger.warning(f"Cookie consent text found for {speaker['name']}, replacing with 'No description available'")
                         speaker_details['description'] = "No description available"
-                    
+
                     # Check if the description is the generic one
                     if GENERIC_DESCRIPTION in speaker_details['description']:
                         logger.warning(f"Generic description found for {speaker['name']}, replacing with 'No description available'")
                         speaker_details['description'] = "No description available"
-                    
+
                     all_speakers.append(speaker_details)
-                    
-                    # Print the extracted information
-                    logger.info(f"Successfully extracted information for {speaker['name']} ({i+1}/{len(speakers_on_page)})")
-                    description_preview = speaker_details['description'][:100] + "..." if len(speaker_details['description']) > 100 else speaker_details['description']
-                    logger.info(f"Description: {description_preview}")
-                    logger.info(f"Session title: {speaker_details['session_title']}")
-                    logger.info(f"Date: {speaker_details['date']}")
-                    logger.info(f"Time: {speaker_details['time']}")
-                    logger.info(f"Location: {speaker_details['location']}")
-                    
-                    # Save progress every 10 speakers
-                    if len(all_speakers) % 10 == 0:
-                        logger.info(f"Saving progress ({len(all_speakers)} speakers processed)")
-                        save_to_json(all_speakers)
-                        save_to_csv(all_speakers)
-                    
+
+                    batch_summaries.append({
+                        'name': speaker_details['name'],
+                        'session_title': speaker_details['session_title'],
+                        'date': speaker_details['date'],
+                        'time': speaker_details['time'],
+                        'location': speaker_details['location'],
+                    })
+
+                    # Stream the record out immediately; the flushes are
+                    # batched so the disk sees one write per FLUSH_EVERY
+                    if orjson is not None:
+                        ndjson_file.write(orjson.dumps(speaker_details) + b"\n")
+                    else:
+                        ndjson_file.write(json.dumps(speaker_details, ensure_ascii=False) + "\n")
+                    if csv_writer is None:
+                        csv_writer = csv.DictWriter(csv_file, fieldnames=list(speaker_details))
+                        csv_writer.writeheader()
+                    csv_writer.writerow(speaker_details)
+                    if len(all_speakers) % FLUSH_EVERY == 0:
+                        ndjson_file.flush()
+                        csv_file.flush()
+
                 except Exception as e:
                     logger.error(f"Error processing speaker {speaker['name']}: {e}")
+
+            logger.info(
+                "Page %d batch: %d/%d extracted: %s",
+                page_num, len(batch_summaries), len(speakers_on_page),
+                json.dumps(batch_summaries, ensure_ascii=False),
+            )
         
         logger.info(f"Processed a total of {len(all_speakers)} speakers across {page_num} pages")
         
-        # Save the final data to JSON and CSV files
-        save_to_json(all_speakers)
-        save_to_csv(all_speakers)
+        # Finalize: close the streamed checkpoints and write the pretty
+        # JSON array once from the in-memory list
+        ndjson_file.close()
+        csv_file.close()
+        # Serialization of the full list is CPU-bound; run it in a
+        # thread so it can't stall the event loop during teardown
+        await asyncio.to_thread(save_to_json, all_speakers)
         
         logger.info("Scraping completed successfully")
         
-        # Close the browser
+        # Close the tuner, the HTTP client, the pooled contexts and the browser
+        if tuner_task is not None:
+            tuner_task.cancel()
+        await http_client.aclose()
+        await pool.close()
         await browser.close()
 
 
@@ -4,287 +4,463 @@ Speaker module for the World Retail Congress Speakers Scraper.
 This module contains functions for extracting speaker information.
 """
 
+import asyncio
 import logging
-from typing import Dict
+import re
+from typing import Dict, Optional
+from urllib.parse import urljoin
 
-from playwright.async_api import Page, Browser
+import httpx
+from playwright.async_api import Browser, BrowserContext, Page
 
 from config import BASE_URL
+from page_parsing import parse_speaker_detail
 from src.utils import GENERIC_DESCRIPTION, accept_cookies
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Injected once per browser context via add_init_script, so every page
+# starts with window.__extractSpeakerInfo already parsed and each call
+# ships a one-line evaluate instead of the function's full source
+_EXTRACT_INIT_JS = f"""
+                // Patterns hoisted to consts so V8 compiles each one once
+                // per page instead of per loop iteration
+                const COOKIE_RE = /(cookie|consent|privacy|necessary cookies|data protection|gdpr|personal data|tracking|third[- ]?party)/i;
+                const DATE_RE = /(\\d{{1,2}})[-–]May[-–](\\d{{4}})/;
+                const DAY_RANGE_RE = /(\\d{{1,2}})(?:st|nd|rd|th)?\\s*[-–]\\s*(\\d{{1,2}})(?:st|nd|rd|th)?\\s*May\\s*(\\d{{4}})?/;
+                const TIME_RE = /(\\d{{1,2}}:\\d{{2}})\\s*[–-]\\s*(\\d{{1,2}}:\\d{{2}})/;
+                const VENUE_RE = /Track\\s*\\d+|[\\w\\s]+Suite/;
+                const VENUE_FALLBACK_RE = /Track\\s*\\d+|[\\w\\s]+Suite|Room\\s*\\w+|Hall\\s*\\w+|Stage\\s*\\w+/;
+                const TITLE_RE = /(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/;
 
-async def extract_speaker_details(page: Page, browser: Browser, speaker: Dict) -> Dict:
-    """
-    Extract detailed information for a speaker by navigating to their page.
-    
-    Args:
-        page: The Playwright page object
-        browser: The Playwright browser object
-        speaker: Dictionary containing basic speaker information
-        
-    Returns:
-        Dictionary containing detailed speaker information
-    """
-    try:
-        speaker_name = speaker['name']
-        logger.info(f"Extracting details for speaker: {speaker_name}")
-        
-        # Check if we have a speaker URL
-        if speaker.get('speakerUrl'):
-            speaker_url = speaker['speakerUrl']
-            
-            # If the URL doesn't start with http, assume it's a relative URL
-            if not speaker_url.startswith('http'):
-                speaker_url = f"{BASE_URL}/{speaker_url}"
-                
-            logger.info(f"Navigating to speaker page: {speaker_url}")
-            
-            # Open a new page for the speaker
-            speaker_page = await browser.new_page()
-            await speaker_page.goto(speaker_url)
-            await speaker_page.wait_for_load_state("networkidle")
-            
-            # Accept cookies if needed
-            await accept_cookies(speaker_page)
-            
-            # Extract detailed information with improved selectors
-            detail_data = await speaker_page.evaluate(f"""
-            () => {{
-                // Function to clean text (remove extra whitespace, newlines, etc.)
-                function cleanText(text) {{
-                    if (!text) return '';
-                    return text.replace(/\\s+/g, ' ').trim();
-                }}
+                window.__extractSpeakerInfo = () => {{
+                    // Function to clean text (remove extra whitespace, newlines, etc.)
+                    function cleanText(text) {{
+                        if (!text) return '';
+                        return text.replace(/\\s+/g, ' ').trim();
+                    }}
                 
-                // Function to check if text is from a cookie consent banner
-                function isCookieConsentText(text) {{
-                    if (!text) return false;
-                    
-                    const cookieKeywords = [
-                        'cookie', 'consent', 'privacy', 'necessary cookies', 
-                        'data protection', 'gdpr', 'personal data', 
-                        'tracking', 'third party', 'third-party'
-                    ];
-                    
-                    const lowerText = text.toLowerCase();
-                    return cookieKeywords.some(keyword => lowerText.includes(keyword.toLowerCase()));
-                }}
+                    // Function to check if text is from a cookie consent banner
+                    function isCookieConsentText(text) {{
+                        return !!text && COOKIE_RE.test(text);
+                    }}
                 
-                // Function to check if text is the generic description
-                function isGenericDescription(text) {{
-                    if (!text) return false;
+                    // Function to check if text is the generic description
+                    function isGenericDescription(text) {{
+                        if (!text) return false;
                     
-                    const genericDesc = "{GENERIC_DESCRIPTION}";
-                    return text.includes(genericDesc);
-                }}
+                        const genericDesc = "{GENERIC_DESCRIPTION}";
+                        return text.includes(genericDesc);
+                    }}
                 
-                // Extract description - look for paragraphs
-                let description = 'No description available';
-                const paragraphs = document.querySelectorAll('p');
-                if (paragraphs.length > 0) {{
-                    // Use the longest paragraph as the description
-                    let longestText = '';
+                    // Extract description - look for paragraphs. Length-gate
+                    // and sort first so short boilerplate is dropped before
+                    // any trimming or scanning; the bio is the longest
+                    // acceptable candidate, so the loop usually exits on the
+                    // first iteration
+                    let description = 'No description available';
+                    const paragraphs = Array.from(document.querySelectorAll('p'))
+                        .filter(p => p.textContent.length > 80);
+                    paragraphs.sort((a, b) => b.textContent.length - a.textContent.length);
                     for (const p of paragraphs) {{
                         const text = p.textContent.trim();
                         // Skip cookie consent text and generic description
-                        if (text.length > longestText.length && 
-                            !isCookieConsentText(text) && 
-                            !isGenericDescription(text)) {{
-                            longestText = text;
+                        if (!isCookieConsentText(text) && !isGenericDescription(text)) {{
+                            description = text;
+                            break;
                         }}
                     }}
-                    if (longestText) {{
-                        description = longestText;
-                    }}
-                }}
                 
-                // Extract session information
-                let sessionInfo = {{
-                    title: 'Not available',
-                    date: 'Not available',
-                    time: 'Not available',
-                    venue: 'Not available'
-                }};
+                    // Extract session information
+                    let sessionInfo = {{
+                        title: 'Not available',
+                        date: 'Not available',
+                        time: 'Not available',
+                        venue: 'Not available'
+                    }};
                 
-                // Look for elements that might contain session information
-                const sessionElements = document.querySelectorAll('.session-title, [class*="session"], [class*="talk"], [class*="presentation"]');
-                for (const el of sessionElements) {{
-                    const text = cleanText(el.textContent);
-                    if (text && text.length > 0 && 
-                        text !== 'We value your privacy' && 
-                        !isCookieConsentText(text)) {{
+                    // Look for elements that might contain session information
+                    const sessionElements = document.querySelectorAll('.session-title, [class*="session"], [class*="talk"], [class*="presentation"]');
+                    for (const el of sessionElements) {{
+                        const text = cleanText(el.textContent);
+                        if (text && text.length > 0 && 
+                            text !== 'We value your privacy' && 
+                            !isCookieConsentText(text)) {{
                         
-                        // Try to parse the session information
-                        // Example format: "Sessions 13-May-2025 12:10 – 12:50 Track 2 Debate: From Traffic to Revenue: Unlock Platform Success with Retail Media"
+                            // Try to parse the session information
+                            // Example format: "Sessions 13-May-2025 12:10 – 12:50 Track 2 Debate: From Traffic to Revenue: Unlock Platform Success with Retail Media"
                         
-                        // Extract date
-                        const dateMatch = text.match(/(\\d{{1,2}})[-–]May[-–](\\d{{4}})/);
-                        if (dateMatch) {{
-                            sessionInfo.date = `${{dateMatch[1]}} May ${{dateMatch[2]}}`;
-                        }}
+                            // Extract date
+                            const dateMatch = text.match(DATE_RE);
+                            if (dateMatch) {{
+                                sessionInfo.date = `${{dateMatch[1]}} May ${{dateMatch[2]}}`;
+                            }}
                         
-                        // Extract time
-                        const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[–-]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                        if (timeMatch) {{
-                            sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                        }}
+                            // Extract time
+                            const timeMatch = text.match(TIME_RE);
+                            if (timeMatch) {{
+                                sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
+                            }}
                         
-                        // Extract venue (Track or Suite)
-                        const venueMatch = text.match(/Track\\s*(\\d+)|([\\w\\s]+Suite)/);
-                        if (venueMatch) {{
-                            sessionInfo.venue = venueMatch[0];
-                        }}
+                            // Extract venue (Track or Suite)
+                            const venueMatch = text.match(VENUE_RE);
+                            if (venueMatch) {{
+                                sessionInfo.venue = venueMatch[0];
+                            }}
                         
-                        // Extract title - assume it's after "Debate:" or similar keywords
-                        const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                        if (titleMatch) {{
-                            sessionInfo.title = titleMatch[1].trim();
-                        }} else {{
-                            // If no specific keyword, just use the last part of the text
-                            const parts = text.split(':');
-                            if (parts.length > 1) {{
-                                sessionInfo.title = parts[parts.length - 1].trim();
+                            // Extract title - assume it's after "Debate:" or similar keywords
+                            const titleMatch = text.match(TITLE_RE);
+                            if (titleMatch) {{
+                                sessionInfo.title = titleMatch[1].trim();
+                            }} else {{
+                                // If no specific keyword, just use the last part of the text
+                                const parts = text.split(':');
+                                if (parts.length > 1) {{
+                                    sessionInfo.title = parts[parts.length - 1].trim();
+                                }}
                             }}
-                        }}
                         
-                        break;
+                            break;
+                        }}
                     }}
-                }}
                 
-                // If session title not found, try other heading elements
-                if (sessionInfo.title === 'Not available') {{
-                    const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
-                    for (const h of headings) {{
-                        const text = cleanText(h.textContent);
-                        // Skip common navigation/website headings and cookie consent text
-                        if (text && text.length > 0 && 
-                            !text.includes('About') && 
-                            !text.includes('Programme') && 
-                            !text.includes('Sponsor') && 
-                            !text.includes('Insights') &&
-                            !text.includes('BOOK YOUR PLACE') &&
-                            !text.includes('We value your privacy') &&
-                            !isCookieConsentText(text)) {{
+                    // If session title not found, try other heading elements
+                    if (sessionInfo.title === 'Not available') {{
+                        const headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
+                        for (const h of headings) {{
+                            const text = cleanText(h.textContent);
+                            // Skip common navigation/website headings and cookie consent text
+                            if (text && text.length > 0 && 
+                                !text.includes('About') && 
+                                !text.includes('Programme') && 
+                                !text.includes('Sponsor') && 
+                                !text.includes('Insights') &&
+                                !text.includes('BOOK YOUR PLACE') &&
+                                !text.includes('We value your privacy') &&
+                                !isCookieConsentText(text)) {{
                             
-                            // Check if it's a session title
-                            if (text.includes('Debate:') || 
-                                text.includes('Briefing:') || 
-                                text.includes('Keynote:') || 
-                                text.includes('Panel:')) {{
+                                // Check if it's a session title
+                                if (text.includes('Debate:') || 
+                                    text.includes('Briefing:') || 
+                                    text.includes('Keynote:') || 
+                                    text.includes('Panel:')) {{
                                 
-                                // Extract the title part
-                                const titleMatch = text.match(/(?:Debate|Briefing|Keynote|Panel|Fireside Chat|Workshop|Presentation):\\s*(.+)$/);
-                                if (titleMatch) {{
-                                    sessionInfo.title = titleMatch[1].trim();
-                                }} else {{
-                                    sessionInfo.title = text;
+                                    // Extract the title part
+                                    const titleMatch = text.match(TITLE_RE);
+                                    if (titleMatch) {{
+                                        sessionInfo.title = titleMatch[1].trim();
+                                    }} else {{
+                                        sessionInfo.title = text;
+                                    }}
+                                    break;
                                 }}
-                                break;
                             }}
                         }}
                     }}
-                }}
                 
-                // Extract date/time if not found in session info
-                if (sessionInfo.date === 'Not available' || sessionInfo.time === 'Not available') {{
-                    const dateElements = document.querySelectorAll('[class*="date"], [class*="time"], [class*="schedule"], time');
-                    for (const el of dateElements) {{
-                        const text = cleanText(el.textContent);
-                        if (text && text.length > 0 && 
-                            !text.includes('About') && 
-                            !text.includes('Programme') && 
-                            !text.includes('Sponsor') && 
-                            !text.includes('Insights') &&
-                            !isCookieConsentText(text)) {{
+                    // Extract date/time if not found in session info
+                    if (sessionInfo.date === 'Not available' || sessionInfo.time === 'Not available') {{
+                        const dateElements = document.querySelectorAll('[class*="date"], [class*="time"], [class*="schedule"], time');
+                        for (const el of dateElements) {{
+                            const text = cleanText(el.textContent);
+                            if (text && text.length > 0 && 
+                                !text.includes('About') && 
+                                !text.includes('Programme') && 
+                                !text.includes('Sponsor') && 
+                                !text.includes('Insights') &&
+                                !isCookieConsentText(text)) {{
                             
-                            // Extract date
-                            const dateMatch = text.match(/(\\d{{1,2}})(?:st|nd|rd|th)?\\s*[-–]\\s*(\\d{{1,2}})(?:st|nd|rd|th)?\\s*May\\s*(\\d{{4}})?/);
-                            if (dateMatch) {{
-                                sessionInfo.date = dateMatch[0];
-                            }}
+                                // Extract date
+                                const dateMatch = text.match(DAY_RANGE_RE);
+                                if (dateMatch) {{
+                                    sessionInfo.date = dateMatch[0];
+                                }}
                             
-                            // Extract time
-                            const timeMatch = text.match(/(\\d{{1,2}}:\\d{{2}})\\s*[-–]\\s*(\\d{{1,2}}:\\d{{2}})/);
-                            if (timeMatch) {{
-                                sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
-                            }}
+                                // Extract time
+                                const timeMatch = text.match(TIME_RE);
+                                if (timeMatch) {{
+                                    sessionInfo.time = `${{timeMatch[1]}} - ${{timeMatch[2]}}`;
+                                }}
                             
-                            break;
+                                break;
+                            }}
                         }}
                     }}
-                }}
                 
-                // If venue not found in session info, look for it separately
-                if (sessionInfo.venue === 'Not available') {{
-                    const venueElements = document.querySelectorAll('[class*="location"], [class*="venue"], [class*="place"], [class*="track"]');
-                    for (const el of venueElements) {{
-                        const text = cleanText(el.textContent);
-                        if (text && text.length > 0 && 
-                            (text.includes('Track') || 
-                             text.includes('Room') || 
-                             text.includes('Hall') || 
-                             text.includes('Suite') ||
-                             text.includes('Stage')) &&
-                            !isCookieConsentText(text)) {{
-                            sessionInfo.venue = text;
-                            break;
-                        }}
-                    }}
-                    
-                    // If still not found, look for location keywords
+                    // If venue not found in session info, look for it separately
                     if (sessionInfo.venue === 'Not available') {{
-                        const allElements = document.querySelectorAll('*');
-                        for (const el of allElements) {{
+                        const venueElements = document.querySelectorAll('[class*="location"], [class*="venue"], [class*="place"], [class*="track"]');
+                        for (const el of venueElements) {{
                             const text = cleanText(el.textContent);
-                            if ((text.includes('Track') || 
-                                text.includes('Room') || 
-                                text.includes('Hall') || 
-                                text.includes('Suite') ||
-                                text.includes('Stage')) &&
+                            if (text && text.length > 0 && 
+                                (text.includes('Track') || 
+                                 text.includes('Room') || 
+                                 text.includes('Hall') || 
+                                 text.includes('Suite') ||
+                                 text.includes('Stage')) &&
                                 !isCookieConsentText(text)) {{
-                                
-                                // Extract just the venue part
-                                const venueMatch = text.match(/Track\\s*(\\d+)|([\\w\\s]+Suite)/);
-                                if (venueMatch) {{
-                                    sessionInfo.venue = venueMatch[0];
-                                    break;
-                                }}
+                                sessionInfo.venue = text;
+                                break;
+                            }}
+                        }}
+                    
+                        // If still not found, read the page's layout text
+                        // once and run a single match over it instead of
+                        // visiting every node
+                        if (sessionInfo.venue === 'Not available') {{
+                            const venueMatch = document.body.innerText.match(VENUE_FALLBACK_RE);
+                            if (venueMatch) {{
+                                sessionInfo.venue = venueMatch[0];
                             }}
                         }}
                     }}
-                }}
                 
-                // Clean up the date field
-                if (sessionInfo.date.includes('12th - 14th May 2025')) {{
-                    sessionInfo.date = '12th - 14th May 2025';
-                }}
+                    // Clean up the date field
+                    if (sessionInfo.date.includes('12th - 14th May 2025')) {{
+                        sessionInfo.date = '12th - 14th May 2025';
+                    }}
                 
-                return {{
-                    description,
-                    session_title: sessionInfo.title,
-                    date: sessionInfo.date,
-                    time: sessionInfo.time,
-                    venue: sessionInfo.venue
+                    return {{
+                        description,
+                        session_title: sessionInfo.title,
+                        date: sessionInfo.date,
+                        time: sessionInfo.time,
+                        venue: sessionInfo.venue
+                    }};
                 }};
-            }}
-            """)
+                """
+
+
+# Matches URLs that are already absolute
+_ABSOLUTE_URL_RE = re.compile(r"^https?://")
+
+# Default detail fields, merged under whatever extraction produced so
+# the result dict is built in one pass instead of five .get() calls
+_DETAIL_FALLBACK = {
+    'description': 'No description available',
+    'session_title': 'Not available',
+    'date': 'Not available',
+    'time': 'Not available',
+    'location': 'Not available',
+}
+
+# Resource types that never affect the extracted text
+_HEAVY_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Analytics/tracker hosts whose requests only delay the page
+_TRACKER_HOSTS = (
+    "googletagmanager.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "hotjar",
+    "facebook.net",
+)
+
+
+async def _block_heavy_resources(route):
+    """Abort requests for resources the text extraction never reads."""
+    request = route.request
+    if request.resource_type in _HEAVY_RESOURCE_TYPES:
+        await route.abort()
+    elif any(host in request.url for host in _TRACKER_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class ContextPool:
+    """
+    Fixed-size pool of long-lived pages, one per rotating browser context.
+
+    Creating a page per speaker pays for CDP target creation, the V8
+    context bootstrap and preload-script injection on every call. Each
+    pool slot instead keeps one page alive and callers just re-navigate
+    it; releasing parks the page on about:blank so per-document state is
+    freed between checkouts. The backing context (and its page) is still
+    recycled after ROTATE_AFTER checkouts so Chromium's RSS stays flat
+    over long runs.
+    """
+
+    # Checkouts before a page's backing context is closed and recreated
+    ROTATE_AFTER = 50
+
+    def __init__(self, browser: Browser, size: int = 4, **context_opts):
+        self._browser = browser
+        self._size = size
+        self._context_opts = context_opts
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Page, int] = {}
+        self._contexts: Dict[Page, BrowserContext] = {}
+
+    async def _new_page(self) -> Page:
+        context = await self._browser.new_context(**self._context_opts)
+        await context.add_init_script(_EXTRACT_INIT_JS)
+        # Extraction only reads text, so the page's visual weight is
+        # dead cost; registered once per context, not per page
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+        self._contexts[page] = context
+        self._uses[page] = 0
+        return page
+
+    async def start(self) -> None:
+        """Create the pooled contexts and their pages up front."""
+        for _ in range(self._size):
+            await self._queue.put(await self._new_page())
+
+    async def acquire(self) -> Page:
+        """Check a page out of the pool, recycling a worn one."""
+        page = await self._queue.get()
+        if self._uses[page] >= self.ROTATE_AFTER:
+            context = self._contexts.pop(page)
+            del self._uses[page]
+            await context.close()
+            page = await self._new_page()
+        self._uses[page] += 1
+        return page
+
+    async def release(self, page: Page) -> None:
+        """Return a page to the pool, dropping its document state."""
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            # A page that can't navigate is worn out; replace the slot
+            context = self._contexts.pop(page)
+            del self._uses[page]
+            await context.close()
+            page = await self._new_page()
+        self._queue.put_nowait(page)
+
+    def recycle(self) -> None:
+        """Mark every page so its context is replaced on next checkout."""
+        for page in self._uses:
+            self._uses[page] = self.ROTATE_AFTER
+
+    async def close(self) -> None:
+        """Close every pooled context."""
+        while not self._queue.empty():
+            await self._contexts.pop(self._queue.get_nowait()).close()
+        self._uses.clear()
+
+
+class AdaptiveSemaphore:
+    """
+    Semaphore whose cap can move while tasks hold it.
+
+    asyncio.Semaphore fixes its limit at construction, but the right
+    number of concurrent extractions depends on how much memory the
+    browser is actually using on this host. Backed by a Condition so
+    raising the cap wakes waiters immediately, while lowering it just
+    lets the excess tasks drain as they finish.
+    """
+
+    def __init__(self, value: int, min_value: int = 1, max_value: int = 8):
+        self._min = min_value
+        self._max = max_value
+        self.cap = max(min_value, min(max_value, value))
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.cap)
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    async def set_cap(self, value: int) -> None:
+        """Clamp and apply a new cap, waking waiters if it grew."""
+        async with self._cond:
+            self.cap = max(self._min, min(self._max, value))
+            self._cond.notify_all()
+
+
+async def extract_speaker_details(
+    page: Page,
+    pool: ContextPool,
+    speaker: Dict,
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> Dict:
+    """
+    Extract detailed information for a speaker from their page.
+
+    The speaker pages are server-rendered, so when an HTTP client is
+    given the page is fetched directly and parsed in-process; a pooled
+    browser context is only used when the plain fetch fails.
+
+    Args:
+        page: The Playwright page object
+        pool: Pool of browser contexts used as the fallback path
+        speaker: Dictionary containing basic speaker information
+        http_client: Shared client for the plain-HTTP fast path
+
+    Returns:
+        Dictionary containing detailed speaker information
+    """
+    try:
+        speaker_name = speaker['name']
+        logger.info(f"Extracting details for speaker: {speaker_name}")
+        
+        # Check if we have a speaker URL
+        if speaker.get('speakerUrl'):
+            speaker_url = speaker['speakerUrl']
             
-            # Close the speaker page
-            await speaker_page.close()
+            # If the URL isn't absolute, resolve it against the base URL
+            if not _ABSOLUTE_URL_RE.match(speaker_url):
+                speaker_url = urljoin(f"{BASE_URL}/", speaker_url)
+                
+            logger.info(f"Navigating to speaker page: {speaker_url}")
             
-            # Combine basic and detailed information
+            # Cheap path: plain HTTP fetch plus in-process parse; no
+            # browser page, navigation or evaluate involved
+            detail_data = None
+            if http_client is not None:
+                try:
+                    response = await http_client.get(speaker_url)
+                    response.raise_for_status()
+                    detail_data = parse_speaker_detail(response.text)
+                except httpx.HTTPError as e:
+                    logger.warning(
+                        f"HTTP fetch failed for {speaker_url}, falling back to browser: {e}"
+                    )
+
+            if detail_data is None:
+                # Borrow a long-lived page from the pool and re-navigate
+                # it; returned (parked on about:blank) in the finally below
+                speaker_page = await pool.acquire()
+                try:
+                    # domcontentloaded plus a targeted selector wait; networkidle
+                    # stalls on analytics beacons long after the content is usable
+                    await speaker_page.goto(speaker_url, wait_until="domcontentloaded")
+                    await speaker_page.wait_for_selector("p, h1", timeout=5000)
+
+                    # Accept cookies if needed
+                    await accept_cookies(speaker_page)
+
+                    # The extraction function was injected at context creation,
+                    # so only this one-line call crosses the protocol per speaker
+                    detail_data = await speaker_page.evaluate("() => window.__extractSpeakerInfo()")
+
+                    # The in-page JS reports the venue under 'venue'; the
+                    # HTTP parser already uses the output key 'location'
+                    detail_data['location'] = detail_data.pop('venue')
+
+                finally:
+                    # Return the page to the pool
+                    await pool.release(speaker_page)
+
+            # Combine basic and detailed information, filling any missing
+            # detail fields from the template in the same merge
             return {
                 'name': speaker_name,
                 'position': speaker.get('position', 'Unknown'),
                 'company': speaker.get('company', 'Unknown'),
-                'description': detail_data.get('description', 'No description available'),
-                'session_title': detail_data.get('session_title', 'Not available'),
-                'date': detail_data.get('date', 'Not available'),
-                'time': detail_data.get('time', 'Not available'),
-                'location': detail_data.get('venue', 'Not available')
+                **_DETAIL_FALLBACK,
+                **detail_data,
             }
         else:
             logger.warning(f"No speaker URL found for {speaker_name}")
@@ -292,11 +468,7 @@ async def extract_speaker_details(page: Page, browser: Browser, speaker: Dict) -
                 'name': speaker_name,
                 'position': speaker.get('position', 'Unknown'),
                 'company': speaker.get('company', 'Unknown'),
-                'description': 'No description available',
-                'session_title': 'Not available',
-                'date': 'Not available',
-                'time': 'Not available',
-                'location': 'Not available'
+                **_DETAIL_FALLBACK,
             }
         
     except Exception as e:
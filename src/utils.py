@@ -11,6 +11,11 @@ from typing import Dict, List
 
 from playwright.async_api import Page
 
+try:
+    import orjson  # C serializer, 2-5x faster than stdlib for our payloads
+except ImportError:
+    orjson = None
+
 from config import OUTPUT_JSON_FILE, OUTPUT_CSV_FILE
 
 # Constants
@@ -363,8 +368,12 @@ def save_to_json(data: List[Dict], filename=None) -> None:
     
     try:
         logger.info(f"Saving {len(data)} records to {filename}")
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, indent=2, ensure_ascii=False, fp=f)
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(data, indent=2, ensure_ascii=False, fp=f)
         logger.info(f"Successfully saved data to {filename}")
     except Exception as e:
         logger.error(f"Error saving data to JSON: {e}")
\ No newline at end of file
@@ -7,14 +7,23 @@ This module contains utility functions for data handling.
 import csv
 import json
 import logging
+import operator
 import os
-from pathlib import Path
 from typing import Dict, List, Optional
 import time
 
-import openai
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Rust-backed JSON, 3-10x faster than stdlib for our payloads
+except ImportError:
+    orjson = None
+
+try:
+    import polars as pl  # Arrow-backed columnar CSV writer, much faster than row-by-row
+except ImportError:
+    pl = None
+
 import config
 
 # Load environment variables
@@ -28,7 +37,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def save_to_json(data: List[Dict], filename: Path) -> None:
+def save_to_json(data: List[Dict], filename: str) -> None:
     """
     Save data to a JSON file.
     
@@ -42,14 +51,44 @@ def save_to_json(data: List[Dict], filename: Path) -> None:
     
     try:
         logger.info(f"Saving {len(data)} records to {filename}")
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, indent=2, ensure_ascii=False, fp=f)
+        # Write to a sidecar file and rename so a crash mid-write can't
+        # leave a truncated checkpoint behind
+        tmp = filename + ".tmp"
+        if orjson is not None:
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, indent=2, ensure_ascii=False, fp=f)
+        os.replace(tmp, filename)
         logger.info(f"Successfully saved data to {filename}")
     except Exception as e:
         logger.error(f"Error saving data to JSON: {e}")
 
 
-def save_to_csv(data: List[Dict], filename: Path) -> None:
+def append_to_jsonl(record: Dict, filename: str) -> None:
+    """
+    Append a single record to a JSON Lines file.
+
+    Unlike save_to_json, this is O(1) per record, which makes it suitable
+    for checkpointing during a scrape without rewriting the whole file.
+
+    Args:
+        record: Dictionary containing the record
+        filename: Path to the JSONL file to append to
+    """
+    try:
+        if orjson is not None:
+            with open(filename, "ab") as f:
+                f.write(orjson.dumps(record) + b"\n")
+        else:
+            with open(filename, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e:
+        logger.error(f"Error appending record to JSONL: {e}")
+
+
+def save_to_csv(data: List[Dict], filename: str) -> None:
     """
     Save data to a CSV file.
     
@@ -63,23 +102,35 @@ def save_to_csv(data: List[Dict], filename: Path) -> None:
     
     try:
         logger.info(f"Saving {len(data)} records to {filename}")
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            # Get field names from the first dictionary
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Write data rows
-            writer.writerows(data)
-            
+        # Write to a sidecar file and rename so a crash mid-write can't
+        # leave a truncated checkpoint behind
+        tmp = filename + ".tmp"
+        if pl is not None:
+            # Columnar bulk write; output matches the DictWriter format
+            pl.from_dicts(data).write_csv(tmp)
+        else:
+            # 1 MiB buffer so the row writes flush in large chunks
+            with open(tmp, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                # Get field names from the first dictionary; a plain
+                # csv.writer fed by a precomputed itemgetter skips
+                # DictWriter's per-row fieldname lookups
+                fieldnames = list(data[0])
+                writer = csv.writer(csvfile)
+
+                # Write header
+                writer.writerow(fieldnames)
+
+                # Write data rows in one C-level pass
+                get_fields = operator.itemgetter(*fieldnames)
+                writer.writerows(map(get_fields, data))
+
+        os.replace(tmp, filename)
         logger.info(f"Successfully saved data to {filename}")
     except Exception as e:
         logger.error(f"Error saving data to CSV: {e}")
 
 
-def load_json(filename: Path) -> List[Dict]:
+def load_json(filename: str) -> List[Dict]:
     """
     Load data from a JSON file.
     
@@ -91,14 +142,18 @@ def load_json(filename: Path) -> List[Dict]:
     """
     try:
         logger.info(f"Loading data from {filename}")
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
         logger.info(f"Successfully loaded {len(data)} records from {filename}")
         return data
     except FileNotFoundError:
         logger.warning(f"File not found: {filename}")
         return []
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, ValueError):
         logger.error(f"Error decoding JSON from {filename}")
         return []
     except Exception as e:
@@ -106,6 +161,43 @@ def load_json(filename: Path) -> List[Dict]:
         return []
 
 
+# Fields filled in by company enrichment
+ENRICHMENT_FIELDS = (
+    "company_type",
+    "company_size",
+    "company_hq_address",
+    "company_hq_country",
+    "company_international",
+)
+
+
+def load_company_cache() -> Dict:
+    """Load the persistent company-enrichment cache (company name -> data)."""
+    try:
+        with open(config.ENRICHMENT_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_company_cache(cache: Dict) -> None:
+    """Persist the company-enrichment cache."""
+    try:
+        with open(config.ENRICHMENT_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        logger.error(f"Error saving company cache: {e}")
+
+
+def _apply_company_data(speaker, company_data: Dict) -> None:
+    """Copy enrichment fields from a result dictionary onto a speaker."""
+    speaker.company_type = company_data.get("company_type", "Not available")
+    speaker.company_size = company_data.get("company_size", "Not available")
+    speaker.company_hq_address = company_data.get("company_hq_address", "Not available")
+    speaker.company_hq_country = company_data.get("company_hq_country", "Not available")
+    speaker.company_international = company_data.get("company_international", "Not available")
+
+
 def enrich_company_data(speaker_collection, api_key: Optional[str] = None) -> bool:
     """
     Enrich speaker data with company information using OpenAI with web browsing capability.
@@ -117,12 +209,20 @@ def enrich_company_data(speaker_collection, api_key: Optional[str] = None) -> bo
     Returns:
         bool: True if enrichment was successful, False otherwise
     """
+    if not config.enable_company_enrichment():
+        logger.info("Company data enrichment is disabled. Skipping...")
+        return False
+
+    # openai is one of the slowest imports in the ecosystem (httpx,
+    # pydantic, ...), so only pay for it when enrichment actually runs
+    import openai
+
     # Set up OpenAI client
     if api_key:
         openai.api_key = api_key
         logger.info("Using provided API key")
     else:
-        openai.api_key = os.getenv("OPENAI_API_KEY")
+        openai.api_key = config.get_openai_key()
         logger.info(f"Using API key from environment: {openai.api_key[:4]}...{openai.api_key[-4:] if openai.api_key else 'None'}")
         
     if not openai.api_key or openai.api_key == "your_openai_api_key_here":
@@ -151,10 +251,20 @@ def enrich_company_data(speaker_collection, api_key: Optional[str] = None) -> bo
         
     logger.info(f"Starting company data enrichment for {len(speakers_to_enrich)} speakers that need enrichment")
     
+    # Previously enriched companies are served from the on-disk cache, so
+    # repeated runs (and speakers sharing a company) skip the API entirely
+    company_cache = load_company_cache()
+
     # Process each speaker that needs enrichment
     for i, speaker in enumerate(speakers_to_enrich):
         logger.info(f"Enriching company data for {speaker.name} ({speaker.company}) - {i+1}/{len(speakers_to_enrich)}")
-        
+
+        cached = company_cache.get(speaker.company.strip().lower())
+        if cached:
+            _apply_company_data(speaker, cached)
+            logger.info(f"Company data for {speaker.company} served from cache")
+            continue
+
         try:
             # Create system message with instructions for web browsing
             system_message = """
@@ -192,42 +302,54 @@ def enrich_company_data(speaker_collection, api_key: Optional[str] = None) -> bo
             Return only the JSON object with the requested information.
             """
             
-            # Call OpenAI API with browsing enabled
-            response = openai.chat.completions.create(
-                model="gpt-4-turbo",  # Using a model that supports browsing
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.2,
-                max_tokens=1000,
-                response_format={"type": "json_object"}  # Request JSON response
-            )
-            
-            # Extract the response content
-            result_text = response.choices[0].message.content.strip()
-            
-            try:
-                # Parse the JSON response
-                company_data = json.loads(result_text)
-                
+            # Route through the cheap model first; escalate to the smart
+            # model only when the cheap one can't answer
+            company_data = None
+            for model in (config.OPENAI_MODEL_FAST, config.OPENAI_MODEL_SMART):
+                response = openai.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=0.2,
+                    max_tokens=1000,
+                    response_format={"type": "json_object"}  # Request JSON response
+                )
+
+                # Extract the response content
+                result_text = response.choices[0].message.content.strip()
+
+                try:
+                    # Parse the JSON response
+                    company_data = json.loads(result_text)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Error parsing JSON response for {speaker.name} from {model}: {e}")
+                    logger.error(f"Response content: {result_text[:100]}...")
+                    continue
+
+                # Confident enough if any field resolved; otherwise escalate
+                if any(company_data.get(field, "Not available") not in ("Not available", "")
+                       for field in ENRICHMENT_FIELDS):
+                    break
+
+                logger.info(f"{model} could not resolve {speaker.company}, escalating...")
+
+            if company_data:
                 # Update speaker with company information
-                speaker.company_type = company_data.get("company_type", "Not available")
-                speaker.company_size = company_data.get("company_size", "Not available")
-                speaker.company_hq_address = company_data.get("company_hq_address", "Not available")
-                speaker.company_hq_country = company_data.get("company_hq_country", "Not available")
-                speaker.company_international = company_data.get("company_international", "Not available")
-                
+                _apply_company_data(speaker, company_data)
+
+                # Persist immediately so later runs (and other speakers from
+                # the same company) are near-free
+                company_cache[speaker.company.strip().lower()] = company_data
+                save_company_cache(company_cache)
+
                 logger.info(f"Successfully enriched company data for {speaker.name} ({speaker.company})")
                 logger.info(f"  Type: {speaker.company_type}")
                 logger.info(f"  Size: {speaker.company_size}")
                 logger.info(f"  HQ: {speaker.company_hq_address}, {speaker.company_hq_country}")
                 logger.info(f"  International: {speaker.company_international}")
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON response for {speaker.name}: {e}")
-                logger.error(f"Response content: {result_text[:100]}...")
-                
+
             # Add a delay to avoid rate limiting
             time.sleep(1.0)
             
@@ -7,7 +7,9 @@ This module contains the Streamlit UI for displaying and interacting with speake
 import asyncio
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -21,9 +23,12 @@ import plotly.express as px
 import streamlit as st
 
 import config
-from controllers.scraper_controller import ScraperController, run_scraper
 from models.speaker import Speaker, SpeakerCollection
 
+# NOTE: controllers.scraper_controller is imported lazily inside the view
+# methods that need it. It transitively pulls in Playwright and the OpenAI
+# client, which would otherwise run before Streamlit can paint anything.
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,14 +37,43 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _warmup_browser():
+    """
+    Launch and close a headless Chromium once in the background.
+
+    Warms the browser binary and profile caches while the user is still
+    looking at the landing page, so the first "scrape" click doesn't pay
+    the 1-2s Chromium cold start.
+    """
+    try:
+        from playwright.async_api import async_playwright
+
+        async def _launch():
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(**config.LAUNCH_OPTS)
+                await browser.close()
+
+        asyncio.run(_launch())
+    except Exception:
+        # Warm-up is best-effort; the scraper launches its own browser anyway
+        logger.debug("Browser warm-up failed", exc_info=True)
+
+
 class StreamlitView:
     """Streamlit view for the World Retail Congress Speakers Scraper."""
     
     def __init__(self):
         """Initialize the Streamlit view."""
         self.speaker_collection = None
-        self.scraper_controller = ScraperController()
         self.setup_page()
+        # Warm up Chromium in the background while the user reads the page
+        if not st.session_state.get("_pw_warmed"):
+            st.session_state["_pw_warmed"] = True
+            threading.Thread(target=_warmup_browser, daemon=True).start()
+        # Import after the page config/header so first paint is not blocked
+        # by the Playwright/OpenAI import chain.
+        from controllers.scraper_controller import ScraperController
+        self.scraper_controller = ScraperController()
     
     def setup_page(self):
         """Set up the Streamlit page."""
@@ -105,11 +139,23 @@ class StreamlitView:
             st.error(f"Error loading data: {e}")
             return False
     
-    async def run_scraper(self):
-        """Run the scraper to collect speaker data."""
+    def run_scraper(self):
+        """Run the scraper on a background thread, streaming progress."""
         try:
+            from controllers.scraper_controller import start_scraper_async
+
+            progress_queue: queue.Queue = queue.Queue()
+            future = start_scraper_async(progress_queue)
+
+            status = st.empty()
             with st.spinner("Scraping speaker data... This may take a few minutes."):
-                self.speaker_collection = await run_scraper()
+                while not future.done():
+                    try:
+                        status.info(progress_queue.get(timeout=0.5))
+                    except queue.Empty:
+                        continue
+
+            self.speaker_collection = future.result()
             
             if self.speaker_collection and self.speaker_collection.speakers:
                 st.success(f"Successfully scraped {len(self.speaker_collection.speakers)} speakers!")